@@ -0,0 +1,19 @@
+-- Migration: 014_prompts_single_active_index.sql
+-- Description: Enforce at most one active Layer 2 prompt per tenant so
+-- activation only has to touch the old and new active rows
+
+-- Keep only the newest active version per tenant before adding the index
+UPDATE prompts p
+SET is_active = false
+WHERE p.is_active
+  AND EXISTS (
+      SELECT 1
+      FROM prompts newer
+      WHERE newer.tenant_id = p.tenant_id
+        AND newer.is_active
+        AND newer.version > p.version
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_prompts_one_active_per_tenant
+    ON prompts (tenant_id)
+    WHERE is_active;
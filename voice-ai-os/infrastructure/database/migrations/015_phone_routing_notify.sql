@@ -0,0 +1,21 @@
+-- Migration: 015_phone_routing_notify.sql
+-- Description: Notify voice-core when phone routes change so its in-memory
+-- routing table drops the affected numbers immediately
+
+CREATE OR REPLACE FUNCTION notify_phone_routing_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('phone_routing_changed', OLD.phone_number);
+    END IF;
+    IF TG_OP = 'INSERT'
+       OR (TG_OP = 'UPDATE' AND NEW.phone_number IS DISTINCT FROM OLD.phone_number) THEN
+        PERFORM pg_notify('phone_routing_changed', NEW.phone_number);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_phone_routing_changed ON phone_routing;
+CREATE TRIGGER trg_phone_routing_changed
+    AFTER INSERT OR UPDATE OR DELETE ON phone_routing
+    FOR EACH ROW EXECUTE FUNCTION notify_phone_routing_changed();
@@ -16,6 +16,13 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_403_FORBIDDEN
 
+# Try to import orjson (optional dependency, faster webhook parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # from ..services.call_history import get_recent_call_history  # Module not found
 def get_recent_call_history(tenant_id: str, phone: str, limit: int = 3):
     """Stub for call history (module not found)"""
@@ -114,7 +121,8 @@ async def telnyx_webhook(request: Request):
     
     # Parse webhook payload
     try:
-        payload = await request.json()
+        body = await request.body()
+        payload = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
     except Exception as exc:
         logger.error(f"Failed to parse Telnyx webhook payload: {exc}")
         raise HTTPException(
@@ -23,6 +23,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from ..database.db_service import get_db_connection
+from ..services.phone_routing import invalidate_tenant
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/tenants", tags=["tenants"])
@@ -250,6 +251,7 @@ async def update_tenant_config(tenant_id: str, config: TenantConfig):
             ),
         )
         conn.commit()
+        invalidate_tenant(tenant_id)
         return config
     except Exception as exc:
         conn.rollback()
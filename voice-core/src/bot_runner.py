@@ -24,12 +24,12 @@ import asyncio
 import base64
 import json
 import struct
+import time
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Set, Any, List
 from datetime import datetime
 import logging
 from dotenv import load_dotenv
-from psycopg2.extras import RealDictCursor
 
 # Load environment variables from .env file
 load_dotenv()
@@ -47,6 +47,8 @@ from pipecat.frames.frames import (
     EndFrame,
     CancelFrame,
     TextFrame,
+    InterruptionFrame,
+    TTSStoppedFrame,
 )
 from pipecat.processors.frame_processor import FrameProcessor
 
@@ -65,9 +67,29 @@ from .events.event_emitter import EventEmitter, VoiceCoreEvent
 from .llm import AllLLMProvidersFailed
 from .tts.multi_provider_tts import AllTTSProvidersFailed
 # from .services.error_tracking import log_system_error  # Module not found
-def log_system_error(error_type: str, error: Exception, context: dict = None):
+def log_system_error(
+    error_type: str,
+    error_message: str,
+    tenant_id: Optional[str] = None,
+    call_id: Optional[str] = None,
+    severity: str = "ERROR",
+    exception: Optional[BaseException] = None,
+    context: dict = None,
+):
     """Stub for error tracking (module not found)"""
-    logger.error(f"System error [{error_type}]: {error}", exc_info=True)
+    level = getattr(logging, severity, logging.ERROR)
+    if not isinstance(level, int):
+        level = logging.ERROR
+    # Trace the passed exception (not whatever sys.exc_info() holds), and only
+    # pay for frame formatting on ERROR/CRITICAL.
+    exc_info = None
+    if exception is not None and exception.__traceback__ and level >= logging.ERROR:
+        exc_info = (type(exception), exception, exception.__traceback__)
+    logger.log(
+        level,
+        f"System error [{error_type}] ({severity}) tenant={tenant_id} call={call_id}: {error_message}",
+        exc_info=exc_info,
+    )
 # from .services.error_monitoring import init_error_monitoring  # Module not found
 def init_error_monitoring():
     """Stub for error monitoring (module not found)"""
@@ -92,7 +114,12 @@ class RateLimitMiddleware:
         self.app = app
     async def __call__(self, scope, receive, send):
         await self.app(scope, receive, send)
-from .services.phone_routing import get_tenant_config
+from .services.phone_routing import get_phone_routing_cache, get_tenant_config
+from .services.asr_services import (
+    close_shared_http_client as close_asr_http_client,
+    prewarm_shared_http_client as prewarm_asr_http_client,
+)
+from .services.call_initiator import close_http_client as close_bot_runner_http_client
 from .api.telnyx_webhook import (
     router as telnyx_router,
     pop_telnyx_call_context,
@@ -118,8 +145,8 @@ from .api.dashboard import router as dashboard_router, broadcast_call_event
 # from .api.calls import router as calls_router
 from .database.db_service import get_db_service
 # from .services.call_history import insert_call_summary  # Module not found
-async def insert_call_summary(*args, **kwargs):
-    """Stub for call history (module not found)"""
+def insert_call_summary(*args, **kwargs):
+    """Stub for call history (module not found); sync like the psycopg2 original"""
     pass
 from .services.phone_routing import normalize_phone_number
 # from .services.telnyx_call_control import create_call as telnyx_create_call  # Module not found
@@ -180,6 +207,10 @@ app.include_router(dashboard_router)
 # app.include_router(call_history_router)
 DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant for SpotFunnel."
 
+# Outbound Telnyx audio is coalesced into ~50ms media messages rather than one
+# WebSocket send per TTS frame.
+TELNYX_OUTPUT_BUFFER_MS = int(os.getenv("TELNYX_OUTPUT_BUFFER_MS", "50"))
+
 # Global state
 @dataclass
 class ActiveCall:
@@ -194,6 +225,9 @@ active_calls: Dict[str, ActiveCall] = {}
 event_emitter = EventEmitter()
 websocket_connections: Set[WebSocket] = set()
 shutdown_requested = False
+# Held so the startup prewarm isn't garbage-collected mid-flight and can be
+# cancelled before the shared ASR client is closed
+prewarm_task: Optional[asyncio.Task] = None
 telnyx_fallback = TelnyxFallbackService()
 
 
@@ -558,22 +592,18 @@ async def start_call(request: StartCallRequest):
             if not connection_id:
                 raise HTTPException(status_code=500, detail="TELNYX_CONNECTION_ID not configured")
 
+            tenant_config = request.config
+            if tenant_config is None and request.tenant_id:
+                tenant_config = await get_tenant_config(request.tenant_id)
+
             from_number = request.from_number
             if not from_number and request.tenant_id:
-                try:
-                    db = get_db_service()
-                    conn = db.get_connection()
-                    cur = conn.cursor(cursor_factory=RealDictCursor)
-                    cur.execute(
-                        "SELECT telephony FROM tenant_onboarding_settings WHERE tenant_id = %s::uuid",
-                        (request.tenant_id,),
-                    )
-                    row = cur.fetchone()
-                    telephony = (row or {}).get("telephony") or {}
-                    from_number = telephony.get("telnyx_phone_number") or telephony.get("phone_number")
-                finally:
-                    cur.close()
-                    db.put_connection(conn)
+                # Telephony settings come back with the (cached) tenant config
+                bundle = tenant_config
+                if not bundle or "telephony" not in bundle:
+                    bundle = await get_tenant_config(request.tenant_id)
+                telephony = (bundle or {}).get("telephony") or {}
+                from_number = telephony.get("telnyx_phone_number") or telephony.get("phone_number")
 
             if not from_number:
                 from_number = os.getenv("TELNYX_FROM_NUMBER")
@@ -598,10 +628,6 @@ async def start_call(request: StartCallRequest):
             if not call_control_id:
                 raise HTTPException(status_code=500, detail="Telnyx call_control_id missing from response")
 
-            tenant_config = request.config
-            if tenant_config is None and request.tenant_id:
-                tenant_config = await get_tenant_config(request.tenant_id)
-
             register_telnyx_call_context(
                 call_control_id,
                 {
@@ -856,37 +882,56 @@ class TelnyxAudioInputProcessor(FrameProcessor):
 class TelnyxAudioOutputProcessor(FrameProcessor):
     """
     Custom processor to send audio to Telnyx WebSocket.
-    Receives AudioRawFrame from TTS and sends to Telnyx as L16.
+    Receives AudioRawFrame from TTS and sends to Telnyx as L16, buffered into
+    TELNYX_OUTPUT_BUFFER_MS chunks.
     """
     
     def __init__(self, websocket: WebSocket, sample_rate: int = 16000):
         super().__init__()
         self.websocket = websocket
         self.sample_rate = sample_rate
+        self._outgoing_audio_buffer = bytearray()
+        self._last_outgoing_send_time = 0.0
+        # 16-bit mono
+        self._flush_bytes = sample_rate * 2 * TELNYX_OUTPUT_BUFFER_MS // 1000
         
     async def process_frame(self, frame: Frame, direction):
         """Process audio frames and send to Telnyx"""
-        # Send audio frames to Telnyx
         if isinstance(frame, AudioRawFrame):
-            try:
-                # Encode audio as base64
-                audio_b64 = base64.b64encode(frame.audio).decode("utf-8")
-                
-                # Send to Telnyx
-                message = {
-                    "event": "media",
-                    "media": {
-                        "payload": audio_b64
-                    }
-                }
-                await self.websocket.send_text(json.dumps(message))
-                
-            except Exception as e:
-                logger.error(f"Error sending audio to Telnyx: {e}")
+            self._outgoing_audio_buffer.extend(frame.audio)
+            elapsed_ms = (time.monotonic() - self._last_outgoing_send_time) * 1000
+            if (
+                len(self._outgoing_audio_buffer) >= self._flush_bytes
+                or elapsed_ms >= TELNYX_OUTPUT_BUFFER_MS
+            ):
+                await self._flush_audio()
+        elif isinstance(frame, InterruptionFrame):
+            # Barge-in: drop buffered speech the caller should no longer hear
+            self._outgoing_audio_buffer.clear()
+        elif isinstance(frame, (TTSStoppedFrame, EndFrame, CancelFrame)):
+            await self._flush_audio()
         
         # Pass frame through
         await self.push_frame(frame, direction)
 
+    async def _flush_audio(self):
+        """Send buffered audio to Telnyx as a single media message"""
+        if not self._outgoing_audio_buffer:
+            return
+        audio_b64 = base64.b64encode(self._outgoing_audio_buffer).decode("utf-8")
+        self._outgoing_audio_buffer.clear()
+        self._last_outgoing_send_time = time.monotonic()
+        try:
+            message = {
+                "event": "media",
+                "media": {
+                    "payload": audio_b64
+                }
+            }
+            await self.websocket.send_text(json.dumps(message))
+        except Exception as e:
+            logger.error(f"Error sending audio to Telnyx: {e}")
+
 
 @app.websocket("/ws/media-stream/{call_control_id}")
 async def telnyx_media_stream(websocket: WebSocket, call_control_id: str):
@@ -1095,8 +1140,13 @@ async def health_check():
 
 @app.on_event("startup")
 async def startup_event():
+    global prewarm_task
     logger.info("Voice Core starting up...")
     start_session_cleanup_task()
+    # Warm DNS + TLS to ASR providers without delaying startup
+    prewarm_task = asyncio.create_task(prewarm_asr_http_client())
+    # Load phone_routing into memory and keep it refreshed in the background
+    get_phone_routing_cache().start()
 
 
 @app.on_event("shutdown")
@@ -1106,7 +1156,7 @@ async def graceful_shutdown():
     
     Reference: production-failure-prevention.md - "Memory Threshold Monitoring"
     """
-    global shutdown_requested
+    global shutdown_requested, prewarm_task
     shutdown_requested = True
     
     logger.info(f"Graceful shutdown initiated. Active calls: {len(active_calls)}")
@@ -1132,6 +1182,20 @@ async def graceful_shutdown():
         logger.info(f"Waiting for {len(active_calls)} calls to complete... ({elapsed:.1f}s elapsed)")
         await asyncio.sleep(5)
     
+    await get_phone_routing_cache().stop()
+
+    if prewarm_task is not None and not prewarm_task.done():
+        prewarm_task.cancel()
+        try:
+            await prewarm_task
+        except asyncio.CancelledError:
+            pass
+    prewarm_task = None
+
+    # Release pooled keep-alive connections
+    await close_asr_http_client()
+    await close_bot_runner_http_client()
+    
     logger.info("Graceful shutdown complete")
 
 
@@ -7,14 +7,51 @@ Handles connection pooling and saving objectives/completed data.
 import os
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, TypeVar
 from datetime import datetime
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
 from psycopg2.pool import ThreadedConnectionPool
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DB_POOL_MAX_CONN = 10
+
+# Dedicated workers for blocking DB calls, sized to the pool so lookups are not
+# queued behind unrelated work in the loop's default executor.
+DB_EXECUTOR = ThreadPoolExecutor(max_workers=DB_POOL_MAX_CONN, thread_name_prefix="db")
+
+# Hot lookups prepared once per pooled connection, so Postgres skips parse/plan
+# on every call. Build the SQL with DatabaseService.lookup_query(), which falls
+# back to the literal query on connections where a PREPARE failed. Disable
+# behind a transaction-mode pooler, where EXECUTE may reach another backend.
+USE_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "true").lower() == "true"
+PREPARED_STATEMENTS = {
+    "phone_routing_lookup": (
+        "SELECT tenant_id FROM phone_routing WHERE phone_number = $1"
+    ),
+    "tenant_config_lookup": (
+        "SELECT t.locale, t.metadata, t.system_prompt, t.agent_role, "
+        "t.agent_personality, t.greeting_message, s.telephony "
+        "FROM tenants t "
+        "LEFT JOIN tenant_onboarding_settings s ON s.tenant_id = t.tenant_id "
+        "WHERE t.tenant_id = $1"
+    ),
+    "active_layer_2_lookup": (
+        "SELECT layer_2_content FROM prompts "
+        "WHERE tenant_id = $1 AND is_active = true "
+        "ORDER BY version DESC LIMIT 1"
+    ),
+}
+_LITERAL_STATEMENTS = {
+    name: query.replace("$1", "%s") for name, query in PREPARED_STATEMENTS.items()
+}
+
 
 class DatabaseService:
     """
@@ -39,13 +76,15 @@ class DatabaseService:
         )
         
         self.pool: Optional[ThreadedConnectionPool] = None
+        # connection -> names successfully prepared on it
+        self._prepared: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
         
     def connect(self):
         """Initialize connection pool."""
         try:
             self.pool = ThreadedConnectionPool(
                 minconn=1,
-                maxconn=10,
+                maxconn=DB_POOL_MAX_CONN,
                 dsn=self.db_url
             )
             logger.info("Database connection pool initialized")
@@ -57,7 +96,38 @@ class DatabaseService:
         """Get connection from pool."""
         if not self.pool:
             self.connect()
-        return self.pool.getconn()
+        conn = self.pool.getconn()
+        if USE_PREPARED_STATEMENTS and conn not in self._prepared:
+            self._prepared[conn] = self._prepare_statements(conn)
+        return conn
+
+    def _prepare_statements(self, conn) -> Set[str]:
+        """
+        PREPARE the hot lookups on a connection the first time it is handed out.
+
+        Each statement is prepared on its own: PREPARE is not undone by a
+        rollback, so one failure must not hide the ones that succeeded.
+        """
+        prepared: Set[str] = set()
+        for name, query in PREPARED_STATEMENTS.items():
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(f"PREPARE {name} AS {query}")
+                conn.commit()
+                prepared.add(name)
+            except psycopg2.errors.DuplicatePreparedStatement:
+                conn.rollback()
+                prepared.add(name)
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Failed to prepare statement {name}: {e}")
+        return prepared
+
+    def lookup_query(self, conn, name: str) -> str:
+        """SQL for a PREPARED_STATEMENTS lookup on `conn`; takes one %s parameter."""
+        if name in self._prepared.get(conn, ()):
+            return f"EXECUTE {name}(%s)"
+        return _LITERAL_STATEMENTS[name]
     
     def put_connection(self, conn):
         """Return connection to pool."""
@@ -234,3 +304,8 @@ def get_db_service() -> DatabaseService:
 def get_db_connection():
     """Get a database connection from the pool."""
     return get_db_service().get_connection()
+
+
+async def run_in_db_executor(fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking DB function on the dedicated DB thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(DB_EXECUTOR, fn, *args)
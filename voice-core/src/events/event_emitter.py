@@ -10,7 +10,7 @@ import os
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterable, Tuple
 from dataclasses import dataclass, asdict
 from collections import deque
 
@@ -111,6 +111,67 @@ class EventEmitter:
                 # Observer failures must not crash conversation
                 logger.error(f"Observer failed for event {event_type}: {e}")
     
+    async def emit_many(
+        self,
+        events: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Emit several events in order as one batch.
+        
+        Events share a timestamp, are written as one log record, and each
+        observer is notified once for the whole batch (async observers get a
+        single task that processes the events in order).
+        
+        Args:
+            events: Iterable of (event_type, data) pairs
+            metadata: Optional metadata applied to every event
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        batch = [
+            VoiceCoreEvent(
+                event_type=event_type,
+                timestamp=timestamp,
+                conversation_id=self.conversation_id,
+                data=data or {},
+                metadata=metadata or {}
+            )
+            for event_type, data in events
+        ]
+        if not batch:
+            return
+        
+        self._log_events(batch)
+        
+        if self._event_log_max > 0:
+            self.event_log.extend(batch)
+        
+        for observer in self.observers:
+            if asyncio.iscoroutinefunction(observer):
+                asyncio.create_task(self._notify_in_order(observer, batch))
+                continue
+            for event in batch:
+                try:
+                    observer(event)
+                except Exception as e:
+                    logger.error(f"Observer failed for event {event.event_type}: {e}")
+    
+    @staticmethod
+    async def _notify_in_order(observer: Callable, batch: List[VoiceCoreEvent]):
+        for event in batch:
+            try:
+                await observer(event)
+            except Exception as e:
+                logger.error(f"Observer failed for event {event.event_type}: {e}")
+    
+    def _log_events(self, batch: List[VoiceCoreEvent]):
+        """Log a batch of events as a single record"""
+        lines = [json.dumps(asdict(event)) for event in batch]
+        logger.info("VOICE_CORE_EVENT: " + "\nVOICE_CORE_EVENT: ".join(lines))
+        if self._log_to_stdout:
+            for event, line in zip(batch, lines):
+                print(f"[EVENT] {event.event_type}: {line}")
+    
     def _log_event(self, event: VoiceCoreEvent):
         """Log event to stdout (structured JSON)"""
         event_dict = asdict(event)
@@ -7,7 +7,7 @@ Manages state transitions, frame routing, and event emission.
 
 from dataclasses import dataclass
 import logging
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Callable, Tuple, TYPE_CHECKING
 
 from pipecat.frames.frames import Frame, TranscriptionFrame, TextFrame, EndFrame
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PendingEvents = List[Tuple[str, Dict[str, Any]]]
+
 
 @dataclass
 class ObjectiveChainCompletedFrame(Frame):
@@ -55,6 +57,13 @@ class MultiPrimitiveProcessor(FrameProcessor):
         self.trace_id = trace_id
         self.captured_data: Dict[str, Any] = {}
         self.chain_started = False
+        # Frame type -> handler (None means pass through unchanged).
+        # Subclasses are resolved via the MRO once and memoized per type.
+        self._frame_handlers: Dict[type, Optional[Callable]] = {
+            TranscriptionFrame: self._process_transcription,
+            EndFrame: None,
+        }
+        self._resolved_handlers: Dict[type, Optional[Callable]] = {}
 
         logger.info(
             "MultiPrimitiveProcessor initialized with %s primitives",
@@ -86,16 +95,26 @@ class MultiPrimitiveProcessor(FrameProcessor):
             await self.push_frame(frame, direction)
             return
 
-        if isinstance(frame, EndFrame):
-            await self.push_frame(frame, direction)
-            return
-
-        if isinstance(frame, TranscriptionFrame):
-            await self._process_transcription(frame, direction)
+        handler = self._resolve_handler(type(frame))
+        if handler is not None:
+            await handler(frame, direction)
             return
 
         await self.push_frame(frame, direction)
 
+    def _resolve_handler(self, frame_type: type) -> Optional[Callable]:
+        try:
+            return self._resolved_handlers[frame_type]
+        except KeyError:
+            pass
+        handler = None
+        for base in frame_type.__mro__:
+            if base in self._frame_handlers:
+                handler = self._frame_handlers[base]
+                break
+        self._resolved_handlers[frame_type] = handler
+        return handler
+
     async def _start_chain(self) -> None:
         self.chain_started = True
 
@@ -111,28 +130,41 @@ class MultiPrimitiveProcessor(FrameProcessor):
 
         await self._start_primitive(self.current_primitive)
 
-    async def _start_primitive(self, primitive: Optional[BaseCaptureObjective]) -> None:
+    async def _start_primitive(
+        self,
+        primitive: Optional[BaseCaptureObjective],
+        pending_events: Optional[PendingEvents] = None,
+    ) -> None:
+        events: PendingEvents = pending_events if pending_events is not None else []
         if primitive is None:
             self._update_multi_asr_state(None)
+            await self._emit_events(events)
             return
 
         logger.info("Starting primitive: %s", primitive.objective_type)
         self._update_multi_asr_state(primitive)
         primitive.state_machine.transition("start")
 
-        if self.event_emitter:
-            await self.event_emitter.emit(
+        events.append(
+            (
                 "primitive_started",
-                data={
+                {
                     "trace_id": self.trace_id,
                     "primitive_type": primitive.objective_type,
                     "primitive_index": self.current_index,
                 },
             )
+        )
+        await self._emit_events(events)
 
         prompt = primitive.get_elicitation_prompt()
         await self.push_frame(TextFrame(text=prompt), FrameDirection.DOWNSTREAM)
 
+    async def _emit_events(self, events: PendingEvents) -> None:
+        """Flush queued events to the emitter in one batch."""
+        if self.event_emitter and events:
+            await self.event_emitter.emit_many(events)
+
     def _update_multi_asr_state(self, primitive: Optional[BaseCaptureObjective]) -> None:
         if not self.multi_asr_processor:
             return
@@ -179,23 +211,25 @@ class MultiPrimitiveProcessor(FrameProcessor):
             "Primitive completed: %s = %s", primitive.objective_type, normalized
         )
 
-        if self.event_emitter:
-            await self.event_emitter.emit(
+        # Completion of this primitive and start of the next are emitted together.
+        pending_events: PendingEvents = [
+            (
                 "primitive_completed",
-                data={
+                {
                     "trace_id": self.trace_id,
                     "primitive_type": primitive.objective_type,
                     "primitive_index": self.current_index,
                     "captured_value": normalized,
                 },
             )
+        ]
 
         self.current_index += 1
 
         if self.is_chain_complete:
-            await self._complete_chain()
+            await self._complete_chain(pending_events)
         else:
-            await self._start_primitive(self.current_primitive)
+            await self._start_primitive(self.current_primitive, pending_events)
 
     async def _fail_primitive(self, primitive: BaseCaptureObjective) -> None:
         logger.warning(
@@ -217,15 +251,18 @@ class MultiPrimitiveProcessor(FrameProcessor):
 
         await self._fail_chain()
 
-    async def _complete_chain(self) -> None:
+    async def _complete_chain(self, pending_events: Optional[PendingEvents] = None) -> None:
         logger.info("Objective chain completed: %s", self.captured_data)
         self._update_multi_asr_state(None)
 
-        if self.event_emitter:
-            await self.event_emitter.emit(
+        events: PendingEvents = pending_events if pending_events is not None else []
+        events.append(
+            (
                 "objective_chain_completed",
-                data={"trace_id": self.trace_id, "captured_data": self.captured_data},
+                {"trace_id": self.trace_id, "captured_data": self.captured_data},
             )
+        )
+        await self._emit_events(events)
 
         await self.push_frame(
             ObjectiveChainCompletedFrame(captured_data=self.captured_data),
@@ -9,6 +9,7 @@ from typing import Set, Optional, List
 
 from pipecat.frames.frames import Frame, FunctionCallsStartedFrame, TTSSpeakFrame
 from pipecat.processors.frame_processor import FrameProcessor
+from ..database.db_service import run_in_db_executor
 from ..tools.knowledge_tool import get_kb_filler_text
 
 
@@ -37,7 +38,10 @@ class KnowledgeFillerProcessor(FrameProcessor):
                         kb_names = call.arguments.get("kb_names")
                     filler_text = None
                     if self.tenant_id:
-                        filler_text = get_kb_filler_text(self.tenant_id, kb_names)
+                        # DB-backed lookup; keep it off the event loop so audio keeps flowing
+                        filler_text = await run_in_db_executor(
+                            get_kb_filler_text, self.tenant_id, kb_names
+                        )
                     await self.push_frame(
                         TTSSpeakFrame(text=filler_text or self.default_filler_text),
                         direction,
@@ -10,12 +10,14 @@ Flow:
 """
 
 import asyncio
+import functools
 import logging
 import os
 import time
-from typing import Optional, List
+from collections import OrderedDict
+from typing import Optional, List, Set, Tuple
 
-from pipecat.frames.frames import Frame, AudioRawFrame, TranscriptionFrame, EndFrame
+from pipecat.frames.frames import Frame, AudioRawFrame, TranscriptionFrame, EndFrame, CancelFrame
 from pipecat.processors.frame_processor import FrameProcessor
 
 from ..events.event_emitter import EventEmitter
@@ -23,10 +25,34 @@ from ..services.asr_services import (
     AssemblyAIService,
     OpenAIAudioService,
     DeepgramBatchService,
+    get_shared_http_client,
+    transcribe_all,
 )
 
 logger = logging.getLogger(__name__)
 
+OPENAI_RANKER_MODEL = os.getenv("OPENAI_RANKER_MODEL", "gpt-4o-mini")
+RANK_CACHE_MAX_ENTRIES = 64
+
+
+def _longest(candidates: List[str]) -> str:
+    """Return the longest candidate (first one wins ties) in a single pass."""
+    best = candidates[0]
+    best_len = len(best)
+    for candidate in candidates[1:]:
+        length = len(candidate)
+        if length > best_len:
+            best, best_len = candidate, length
+    return best
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client(api_key: str):
+    """Return a shared AsyncOpenAI client so ranking calls reuse warm connections."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
+
 
 class MultiASRProcessor(FrameProcessor):
     """
@@ -44,9 +70,16 @@ class MultiASRProcessor(FrameProcessor):
         event_emitter: Optional[EventEmitter] = None,
     ):
         super().__init__()
-        self.deepgram_batch = deepgram_batch or DeepgramBatchService.from_env()
-        self.assemblyai = assemblyai or AssemblyAIService.from_env()
-        self.openai_audio = openai_audio or OpenAIAudioService.from_env()
+        http_client = get_shared_http_client()
+        self.deepgram_batch = deepgram_batch or DeepgramBatchService.from_env(
+            http_client=http_client
+        )
+        self.assemblyai = assemblyai or AssemblyAIService.from_env(
+            http_client=http_client
+        )
+        self.openai_audio = openai_audio or OpenAIAudioService.from_env(
+            http_client=http_client
+        )
         self.event_emitter = event_emitter
         self.multi_asr_enabled = False
         self.vote_count = 0
@@ -55,6 +88,12 @@ class MultiASRProcessor(FrameProcessor):
         self.last_audio_time: Optional[float] = None
         self.last_direction = None
         self.silence_task: Optional[asyncio.Task] = None
+        self._audio_event = asyncio.Event()
+        # Flushed buffers are transcribed in the background while capture
+        # continues into a fresh buffer; the lock keeps emission in flush order.
+        self._flush_lock = asyncio.Lock()
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._rank_cache: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
         self.sample_rate = int(os.getenv("MULTI_ASR_SAMPLE_RATE", "16000"))
         self.channels = int(os.getenv("MULTI_ASR_CHANNELS", "1"))
         self.bytes_per_sample = int(os.getenv("MULTI_ASR_BYTES_PER_SAMPLE", "2"))
@@ -65,19 +104,30 @@ class MultiASRProcessor(FrameProcessor):
             os.getenv("MULTI_ASR_SILENCE_TIMEOUT_MS", "1000")
         )
 
+        # Start on the pass-through fast path until a primitive enables voting.
+        self.process_frame = self._passthrough
+
         logger.info("MultiASRProcessor initialized (conditional activation)")
 
     def enable_multi_asr(self) -> None:
         """Enable multi-ASR voting (for critical primitives)."""
         self.multi_asr_enabled = True
+        # Drop the instance-level override so the class process_frame is used.
+        self.__dict__.pop("process_frame", None)
         logger.debug("Multi-ASR voting ENABLED")
 
     def disable_multi_asr(self) -> None:
         """Disable multi-ASR voting (fall back to downstream STT)."""
         self.multi_asr_enabled = False
         self._reset_buffer()
+        self._stop_silence_watchdog()
+        self.process_frame = self._passthrough
         logger.debug("Multi-ASR voting DISABLED (single ASR fast path)")
 
+    def _passthrough(self, frame: Frame, direction):
+        """Disabled fast path: forward every frame untouched."""
+        return self.push_frame(frame, direction)
+
     async def process_frame(self, frame: Frame, direction):
         if isinstance(frame, AudioRawFrame):
             print(
@@ -109,15 +159,25 @@ class MultiASRProcessor(FrameProcessor):
         if isinstance(frame, EndFrame):
             if self.multi_asr_enabled:
                 await self._flush_buffer(direction)
+            await self._drain_pending_flushes()
+            self._stop_silence_watchdog()
+            await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, CancelFrame):
+            self._stop_silence_watchdog()
+            self._reset_buffer()
+            await self._cancel_pending_flushes()
             await self.push_frame(frame, direction)
             return
 
         await self.push_frame(frame, direction)
 
     def _buffer_audio(self, audio_bytes: bytes, direction) -> None:
+        now = time.monotonic()
         if self.buffer_start_time is None:
-            self.buffer_start_time = time.time()
-        self.last_audio_time = time.time()
+            self.buffer_start_time = now
+        self.last_audio_time = now
         self.last_direction = direction
         self.audio_buffer.extend(audio_bytes)
         self._ensure_silence_task()
@@ -129,63 +189,101 @@ class MultiASRProcessor(FrameProcessor):
         return (len(self.audio_buffer) / bytes_per_second) * 1000.0
 
     def _ensure_silence_task(self) -> None:
+        self._audio_event.set()
         if self.silence_task and not self.silence_task.done():
             return
         self.silence_task = asyncio.create_task(self._silence_watchdog())
 
+    def _stop_silence_watchdog(self) -> None:
+        if self.silence_task and not self.silence_task.done():
+            self.silence_task.cancel()
+        self.silence_task = None
+
     async def _silence_watchdog(self) -> None:
+        """
+        Runs while audio is buffered: each buffered chunk sets `_audio_event`;
+        if no chunk arrives within the silence timeout, the buffer is flushed
+        and the watchdog exits. `_ensure_silence_task` starts a new one with
+        the next buffered chunk.
+        """
         while self.audio_buffer:
-            await asyncio.sleep(self.silence_timeout_ms / 1000.0)
-            if not self.last_audio_time:
-                continue
-            elapsed = (time.time() - self.last_audio_time) * 1000.0
-            if elapsed >= self.silence_timeout_ms:
+            self._audio_event.clear()
+            try:
+                await asyncio.wait_for(
+                    self._audio_event.wait(),
+                    timeout=self.silence_timeout_ms / 1000.0,
+                )
+            except asyncio.TimeoutError:
                 await self._flush_buffer(self.last_direction)
                 return
 
     async def _flush_buffer(self, direction) -> None:
         if not self.audio_buffer:
             return
-        audio_bytes = bytes(self.audio_buffer)
+        # Swap buffers so new audio keeps landing in `audio_buffer` while the
+        # flushed one is transcribed.
+        flushing, self.audio_buffer = self.audio_buffer, bytearray()
         self._reset_buffer()
 
-        transcript = await self._multi_asr_transcribe(audio_bytes)
-        if transcript:
-            transcription_frame = TranscriptionFrame(
-                text=transcript,
-                user_id="user",
-                timestamp=None,
-            )
-            transcription_frame.multi_asr_used = True
-            await self._emit_vote_event(transcript)
-            await self.push_frame(transcription_frame, direction)
-            return
+        task = asyncio.create_task(self._transcribe_and_emit(flushing, direction))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Multi-ASR background transcription failed", exc_info=task.exception())
+
+    async def _drain_pending_flushes(self) -> None:
+        """Wait for in-flight background transcriptions to finish emitting."""
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def _cancel_pending_flushes(self) -> None:
+        """Cancel in-flight transcriptions so nothing is pushed after a cancel."""
+        tasks = list(self._flush_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _transcribe_and_emit(self, audio: bytearray, direction) -> None:
+        async with self._flush_lock:
+            transcript = await self._multi_asr_transcribe(audio)
+            if transcript:
+                transcription_frame = TranscriptionFrame(
+                    text=transcript,
+                    user_id="user",
+                    timestamp=None,
+                )
+                transcription_frame.multi_asr_used = True
+                await self._emit_vote_event(transcript)
+                await self.push_frame(transcription_frame, direction)
+                return
 
-        logger.warning("Multi-ASR failed; falling back to downstream STT")
-        await self.push_frame(
-            AudioRawFrame(
-                audio=audio_bytes,
-                sample_rate=self.sample_rate,
-                num_channels=self.channels,
-            ),
-            direction,
-        )
+            logger.warning("Multi-ASR failed; falling back to downstream STT")
+            await self.push_frame(
+                AudioRawFrame(
+                    audio=bytes(audio),
+                    sample_rate=self.sample_rate,
+                    num_channels=self.channels,
+                ),
+                direction,
+            )
 
     def _reset_buffer(self) -> None:
         self.audio_buffer.clear()
         self.buffer_start_time = None
         self.last_audio_time = None
         self.last_direction = None
-        if self.silence_task and not self.silence_task.done():
-            self.silence_task.cancel()
 
     async def _multi_asr_transcribe(self, audio_bytes: bytes) -> str:
         try:
-            results = await asyncio.gather(
-                self.deepgram_batch.transcribe(audio_bytes),
-                self.assemblyai.transcribe(audio_bytes),
-                self.openai_audio.transcribe(audio_bytes),
-                return_exceptions=True,
+            results = await transcribe_all(
+                audio_bytes,
+                (self.deepgram_batch, self.assemblyai, self.openai_audio),
+                sample_rate=self.sample_rate,
+                channels=self.channels,
             )
 
             candidates = self._filter_candidates(results)
@@ -204,13 +302,12 @@ class MultiASRProcessor(FrameProcessor):
 
     @staticmethod
     def _filter_candidates(results: List[object]) -> List[str]:
-        candidates: List[str] = []
-        for result in results:
-            if isinstance(result, Exception):
-                continue
-            if isinstance(result, str) and result.strip():
-                candidates.append(result.strip())
-        return candidates
+        # Failed transcriptions come back as "" (or exceptions, which are never strings).
+        return [
+            text
+            for result in results
+            if isinstance(result, str) and (text := result.strip())
+        ]
 
     async def _rank_candidates(self, candidates: List[str]) -> str:
         if len(candidates) == 1:
@@ -218,12 +315,15 @@ class MultiASRProcessor(FrameProcessor):
 
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
-            return max(candidates, key=len)
+            return _longest(candidates)
 
-        try:
-            from openai import AsyncOpenAI
+        cache_key = tuple(sorted(candidates))
+        cached = self._rank_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            client = AsyncOpenAI(api_key=api_key)
+        try:
+            client = _get_openai_client(api_key)
             candidates_text = "\n".join(
                 f"{index + 1}. {candidate}" for index, candidate in enumerate(candidates)
             )
@@ -235,7 +335,7 @@ class MultiASRProcessor(FrameProcessor):
                 "Return ONLY the number (1, 2, or 3) of the best transcription."
             )
             response = await client.chat.completions.create(
-                model=os.getenv("OPENAI_RANKER_MODEL", "gpt-4o-mini"),
+                model=OPENAI_RANKER_MODEL,
                 messages=[
                     {
                         "role": "system",
@@ -249,11 +349,15 @@ class MultiASRProcessor(FrameProcessor):
             choice_text = response.choices[0].message.content.strip()
             choice_num = int(choice_text)
             if 1 <= choice_num <= len(candidates):
-                return candidates[choice_num - 1]
+                best = candidates[choice_num - 1]
+                self._rank_cache[cache_key] = best
+                if len(self._rank_cache) > RANK_CACHE_MAX_ENTRIES:
+                    self._rank_cache.popitem(last=False)
+                return best
         except Exception as exc:
             logger.error("LLM ranking failed: %s", exc)
 
-        return max(candidates, key=len)
+        return _longest(candidates)
 
     async def _emit_vote_event(self, transcript: str) -> None:
         if not self.event_emitter:
@@ -271,9 +375,10 @@ class MultiASRProcessor(FrameProcessor):
         cls,
         event_emitter: Optional[EventEmitter] = None,
     ) -> "MultiASRProcessor":
+        http_client = get_shared_http_client()
         return cls(
-            deepgram_batch=DeepgramBatchService.from_env(),
-            assemblyai=AssemblyAIService.from_env(),
-            openai_audio=OpenAIAudioService.from_env(),
+            deepgram_batch=DeepgramBatchService.from_env(http_client=http_client),
+            assemblyai=AssemblyAIService.from_env(http_client=http_client),
+            openai_audio=OpenAIAudioService.from_env(http_client=http_client),
             event_emitter=event_emitter,
         )
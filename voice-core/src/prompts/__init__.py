@@ -1,5 +1,13 @@
 """Layer 1 core prompts (immutable receptionist behavior)."""
 
-from .layer1_receptionist_core import LAYER_1_CORE_PROMPT
+from .layer1_receptionist_core import (
+    LAYER_1_CORE_PROMPT,
+    LAYER_1_CORE_PROMPT_STRIPPED,
+    get_layer1_core_prompt,
+)
 
-__all__ = ["LAYER_1_CORE_PROMPT"]
+__all__ = [
+    "LAYER_1_CORE_PROMPT",
+    "LAYER_1_CORE_PROMPT_STRIPPED",
+    "get_layer1_core_prompt",
+]
@@ -7,10 +7,13 @@ Combines:
 3. Layer 2 system prompt (agent role/personality/objectives)
 """
 
+import functools
 from typing import Optional
 
 import tiktoken
 
+from .layer1_receptionist_core import get_layer1_core_prompt
+
 MAX_STATIC_KNOWLEDGE_TOKENS = 10_000
 
 
@@ -18,6 +21,17 @@ class KnowledgeTooLargeError(ValueError):
     """Raised when static knowledge exceeds 10K token limit."""
 
 
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    return tiktoken.encoding_for_model("gpt-4")
+
+
+@functools.lru_cache(maxsize=256)
+def _token_count(knowledge: str) -> int:
+    """Token count for `knowledge`, memoized since knowledge rarely changes."""
+    return len(_get_encoding().encode(knowledge))
+
+
 def validate_static_knowledge(knowledge: str) -> int:
     """
     Validate static knowledge size before storing it.
@@ -34,8 +48,7 @@ def validate_static_knowledge(knowledge: str) -> int:
     if not knowledge:
         return 0
 
-    encoding = tiktoken.encoding_for_model("gpt-4")
-    token_count = len(encoding.encode(knowledge))
+    token_count = _token_count(knowledge)
 
     if token_count > MAX_STATIC_KNOWLEDGE_TOKENS:
         raise KnowledgeTooLargeError(
@@ -96,3 +109,29 @@ def combine_prompts(
         sections.append(layer2_section)
 
     return "\n\n".join(sections)
+
+
+@functools.lru_cache(maxsize=512)
+def build_system_prompt(
+    layer2_system_prompt: Optional[str],
+    static_knowledge: Optional[str] = None,
+) -> str:
+    """
+    Build the full system prompt on top of the Layer 1 core prompt, memoized.
+
+    Layer 1 is immutable and Layer 2/knowledge change rarely per tenant, so
+    repeat calls return the identical string. Keeping the prefix byte-stable
+    also lets provider-side prompt prefix caching hit on every call.
+
+    Args:
+        layer2_system_prompt: Layer 2 system prompt for the tenant.
+        static_knowledge: Tier 1 knowledge provided by the customer.
+
+    Returns:
+        Combined prompt string ready for LLM calls.
+    """
+    return combine_prompts(
+        layer1_core_prompt=get_layer1_core_prompt(),
+        static_knowledge=static_knowledge,
+        layer2_system_prompt=layer2_system_prompt,
+    )
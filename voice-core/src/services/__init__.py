@@ -1,12 +1,21 @@
-"""Service wrappers for external providers."""
+"""Service wrappers for external providers.
 
-from .asr_services import AssemblyAIService, OpenAIAudioService, DeepgramBatchService
-from .call_initiator import start_bot_call
-from .phone_routing import (
-    get_tenant_config,
-    normalize_phone_number,
-    resolve_phone_to_tenant,
-)
+Submodules are imported lazily (PEP 562) so importing one service does not
+pull in every provider SDK and the database driver.
+"""
+
+import importlib
+
+_LAZY_IMPORTS = {
+    "AssemblyAIService": ".asr_services",
+    "DeepgramBatchService": ".asr_services",
+    "OpenAIAudioService": ".asr_services",
+    "start_bot_call": ".call_initiator",
+    "get_tenant_config": ".phone_routing",
+    "resolve_phone_to_tenant": ".phone_routing",
+    "normalize_phone_number": ".phone_routing",
+    "invalidate_tenant": ".phone_routing",
+}
 
 __all__ = [
     "AssemblyAIService",
@@ -16,4 +25,14 @@ __all__ = [
     "get_tenant_config",
     "resolve_phone_to_tenant",
     "normalize_phone_number",
+    "invalidate_tenant",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,22 +3,231 @@ ASR service wrappers for multi-ASR voting (batch mode).
 
 Supports:
 - Deepgram (batch REST API)
-- AssemblyAI Universal-2 (batch SDK)
+- AssemblyAI Universal-2 (batch REST API)
 - OpenAI GPT-4o-transcribe (batch API)
 """
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 import asyncio
+import hashlib
 import io
 import logging
 import os
-import tempfile
-import wave
+import random
+import struct
+import time
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson (optional dependency, faster response parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Clips shorter than this are not worth a provider round-trip.
+MIN_AUDIO_DURATION_S = float(os.getenv("MULTI_ASR_MIN_AUDIO_SECONDS", "0.1"))
+
+# Transient provider errors worth a quick retry; anything else fails immediately.
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY_S = 0.05
+
+# Identical audio sent to the same provider configuration is coalesced while
+# in flight and served from a short-lived result cache afterwards.
+RESULT_CACHE_TTL_S = 30.0
+RESULT_CACHE_MAX_ENTRIES = 128
+
+_TranscriptKey = Tuple[Tuple[str, ...], bytes]
+_inflight: Dict[_TranscriptKey, "asyncio.Future[str]"] = {}
+_recent_results: "OrderedDict[_TranscriptKey, Tuple[float, str]]" = OrderedDict()
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client shared by all batch ASR services.
+
+    The three providers are always called together during a multi-ASR vote,
+    so a single keep-alive pool avoids a fresh TCP/TLS handshake per request.
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+        )
+    return _shared_http_client
+
+
+# Provider hosts reached through the shared client, keyed by the env var that enables them.
+_PREWARM_URLS = {
+    "DEEPGRAM_API_KEY": "https://api.deepgram.com/",
+    "ASSEMBLYAI_API_KEY": "https://api.assemblyai.com/",
+    "OPENAI_API_KEY": "https://api.openai.com/",
+}
+
+
+async def prewarm_shared_http_client() -> None:
+    """
+    Resolve DNS and complete TLS handshakes to the configured ASR providers.
+
+    Called at startup so the first multi-ASR vote reuses warm connections.
+    """
+    urls = [url for env_var, url in _PREWARM_URLS.items() if os.getenv(env_var)]
+    if not urls:
+        return
+    client = get_shared_http_client()
+    results = await asyncio.gather(
+        *(client.head(url, timeout=5.0) for url in urls),
+        return_exceptions=True,
+    )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.debug("ASR connection prewarm failed for %s: %s", url, result)
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared ASR HTTP client (called on application shutdown)."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(
+    pcm_len: int,
+    sample_rate: int,
+    channels: int,
+    sample_width: int = 2,
+) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for `pcm_len` bytes of PCM data."""
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + pcm_len,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * channels * sample_width,
+        channels * sample_width,
+        sample_width * 8,
+        b"data",
+        pcm_len,
+    )
+
+
+class ProviderTimeoutError(Exception):
+    """Raised when a provider accepts a job but does not finish it in time."""
+
+
+def _is_provider_failure(exc: BaseException) -> bool:
+    """True for errors that mean the provider is unavailable (429, 5xx, transport, timeout)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, (httpx.TransportError, ProviderTimeoutError))
+
+
+async def _request_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Send a request, retrying transient statuses with jittered backoff.
+
+    `send` is called once per attempt so streamed bodies can be rebuilt.
+    Raises httpx.HTTPStatusError for the final non-2xx response.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        response = await send()
+        if response.status_code in RETRYABLE_STATUS_CODES and attempt < MAX_ATTEMPTS - 1:
+            await asyncio.sleep(RETRY_BASE_DELAY_S * 2**attempt + random.random() * 0.02)
+            continue
+        break
+    response.raise_for_status()
+    return response
+
+
+class _ProviderCircuitBreaker:
+    """
+    Consecutive-failure circuit breaker shared by the batch ASR services.
+
+    Only provider outages (see _is_provider_failure) count. After
+    `failure_threshold` of them the provider is skipped; once
+    `recovery_timeout` passes a single trial request is let through, and
+    its first failure reopens the breaker.
+    """
+
+    def _init_circuit_breaker(self, provider: str) -> None:
+        self._breaker_name = provider
+        self.failure_count = 0
+        self.failure_threshold = 5  # Skip provider after 5 consecutive failures
+        self.circuit_open = False
+        self.last_failure_time: Optional[float] = None
+        self.recovery_timeout = 10  # Try the provider again after 10 seconds
+        self.trial_in_flight = False  # Half-open: one request decides
+
+    def _circuit_allows_request(self) -> bool:
+        if not self.circuit_open:
+            return True
+        if self.trial_in_flight:
+            return False
+        if time.monotonic() - (self.last_failure_time or 0.0) < self.recovery_timeout:
+            return False
+        logger.info("%s circuit breaker: half-open, sending one trial request", self._breaker_name)
+        self.trial_in_flight = True
+        return True
+
+    def _record_success(self) -> None:
+        self.failure_count = 0
+        self.circuit_open = False
+        self.trial_in_flight = False
+
+    def _record_failure(self) -> None:
+        self.failure_count += 1
+        # A failed half-open trial reopens at once; otherwise open at the threshold
+        if self.trial_in_flight or (
+            not self.circuit_open and self.failure_count >= self.failure_threshold
+        ):
+            self.trial_in_flight = False
+            self.circuit_open = True
+            self.last_failure_time = time.monotonic()
+            logger.warning(
+                "%s circuit breaker OPEN after %s failures. Will retry in %ss",
+                self._breaker_name,
+                self.failure_count,
+                self.recovery_timeout,
+            )
+
+    def _record_error(self, exc: BaseException) -> None:
+        if _is_provider_failure(exc):
+            self._record_failure()
+        else:
+            # The provider answered (e.g. bad key or request); it is not down
+            self._record_success()
+
+
+def _is_too_short(
+    audio_bytes: bytes, sample_rate: int, channels: int, sample_width: int = 2
+) -> bool:
+    """True when `audio_bytes` is empty or below MIN_AUDIO_DURATION_S."""
+    if not audio_bytes:
+        return True
+    return len(audio_bytes) < sample_rate * channels * sample_width * MIN_AUDIO_DURATION_S
+
 
 def _pcm_to_wav_bytes(
     pcm_bytes: bytes,
@@ -26,16 +235,15 @@ def _pcm_to_wav_bytes(
     channels: int,
     sample_width: int = 2,
 ) -> bytes:
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_bytes)
-    return buffer.getvalue()
+    return _wav_header(len(pcm_bytes), sample_rate, channels, sample_width) + pcm_bytes
 
 
-class DeepgramBatchService:
+ASSEMBLYAI_BASE_URL = "https://api.assemblyai.com/v2"
+ASSEMBLYAI_POLL_INTERVAL_S = 0.5
+ASSEMBLYAI_TIMEOUT_S = 30.0
+
+
+class DeepgramBatchService(_ProviderCircuitBreaker):
     """
     Deepgram batch transcription via REST API.
 
@@ -49,6 +257,7 @@ class DeepgramBatchService:
         language: str = "en-AU",
         sample_rate: int = 16000,
         channels: int = 1,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key = api_key or os.getenv("DEEPGRAM_API_KEY")
         self.enabled = bool(self.api_key)
@@ -56,32 +265,56 @@ class DeepgramBatchService:
         self.language = language
         self.sample_rate = sample_rate
         self.channels = channels
+        self.http_client = http_client
+        self._init_circuit_breaker("Deepgram batch")
+
         if not self.enabled:
             logger.warning("DeepgramBatchService disabled (DEEPGRAM_API_KEY missing)")
 
-    async def transcribe(self, audio_bytes: bytes) -> str:
+    async def transcribe(
+        self, audio_bytes: bytes, wav_bytes: Optional[bytes] = None
+    ) -> str:
         if not self.enabled:
             return ""
+        if _is_too_short(audio_bytes, self.sample_rate, self.channels):
+            return ""
+
+        if not self._circuit_allows_request():
+            return ""
 
         try:
-            wav_bytes = _pcm_to_wav_bytes(
-                audio_bytes, sample_rate=self.sample_rate, channels=self.channels
-            )
+            # Only the top transcript is used, so request the smallest response.
             params = {
                 "model": self.model,
                 "language": self.language,
                 "punctuate": "true",
+                "smart_format": "false",
+                "diarize": "false",
+                "utterances": "false",
+                "paragraphs": "false",
+                "summarize": "false",
+                "detect_language": "false",
+                "filler_words": "false",
+                "alternatives": "1",
+            }
+            headers = {
+                "Authorization": f"Token {self.api_key}",
+                "Content-Type": "audio/wav",
             }
-            headers = {"Authorization": f"Token {self.api_key}"}
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
+            if wav_bytes is None:
+                wav_bytes = _pcm_to_wav_bytes(audio_bytes, self.sample_rate, self.channels)
+            client = self.http_client or get_shared_http_client()
+
+            response = await _request_with_retry(
+                lambda: client.post(
                     "https://api.deepgram.com/v1/listen",
                     params=params,
                     headers=headers,
                     content=wav_bytes,
                 )
-            response.raise_for_status()
-            data = response.json()
+            )
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+            self._record_success()
             alternatives = (
                 data.get("results", {})
                 .get("channels", [{}])[0]
@@ -91,15 +324,18 @@ class DeepgramBatchService:
                 return alternatives[0].get("transcript", "") or ""
             return ""
         except Exception as exc:
+            self._record_error(exc)
             logger.error("Deepgram batch transcription failed: %s", exc)
             return ""
 
     @classmethod
-    def from_env(cls) -> "DeepgramBatchService":
-        return cls()
+    def from_env(
+        cls, http_client: Optional[httpx.AsyncClient] = None
+    ) -> "DeepgramBatchService":
+        return cls(http_client=http_client)
 
 
-class AssemblyAIService:
+class AssemblyAIService(_ProviderCircuitBreaker):
     """
     AssemblyAI wrapper for multi-ASR voting.
 
@@ -112,63 +348,100 @@ class AssemblyAIService:
         api_key: Optional[str] = None,
         sample_rate: int = 16000,
         channels: int = 1,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize AssemblyAI service.
 
         Args:
             api_key: AssemblyAI API key (defaults to ASSEMBLYAI_API_KEY env var)
+            http_client: Optional shared HTTP client (defaults to the module pool)
         """
         self.api_key = api_key or os.getenv("ASSEMBLYAI_API_KEY")
         self.sample_rate = sample_rate
         self.channels = channels
+        self.http_client = http_client
         self.enabled = bool(self.api_key)
+        self._init_circuit_breaker("AssemblyAI")
         if not self.enabled:
             logger.warning("AssemblyAIService disabled (ASSEMBLYAI_API_KEY missing)")
 
-    async def transcribe(self, audio_bytes: bytes) -> str:
+    async def transcribe(
+        self, audio_bytes: bytes, wav_bytes: Optional[bytes] = None
+    ) -> str:
         """
         Transcribe audio to text.
 
+        Uses the REST API (upload -> create transcript -> poll) on the shared
+        async client rather than the sync SDK in a worker thread.
+
         Args:
             audio_bytes: Raw audio data (16kHz, PCM16)
+            wav_bytes: Optional pre-encoded WAV of `audio_bytes` (skips encoding)
 
         Returns:
             Transcribed text (empty string if not configured)
         """
         if not self.enabled:
             return ""
+        if _is_too_short(audio_bytes, self.sample_rate, self.channels):
+            return ""
+        if not self._circuit_allows_request():
+            return ""
 
         try:
-            import assemblyai as aai
+            if wav_bytes is None:
+                wav_bytes = _pcm_to_wav_bytes(audio_bytes, self.sample_rate, self.channels)
 
-            aai.settings.api_key = self.api_key
-            transcriber = aai.Transcriber()
-            config = aai.TranscriptionConfig(language_code="en_au")
+            client = self.http_client or get_shared_http_client()
+            headers = {"Authorization": self.api_key}
 
-            wav_bytes = _pcm_to_wav_bytes(
-                audio_bytes, sample_rate=self.sample_rate, channels=self.channels
-            )
-            with tempfile.NamedTemporaryFile(suffix=".wav") as temp_file:
-                temp_file.write(wav_bytes)
-                temp_file.flush()
-                transcript = await asyncio.to_thread(
-                    transcriber.transcribe, temp_file.name, config=config
+            upload = await _request_with_retry(
+                lambda: client.post(
+                    f"{ASSEMBLYAI_BASE_URL}/upload", headers=headers, content=wav_bytes
                 )
+            )
+            audio_url = upload.json()["upload_url"]
 
-            if transcript.status == aai.TranscriptStatus.error:
-                logger.error("AssemblyAI error: %s", transcript.error)
-                return ""
+            created = await _request_with_retry(
+                lambda: client.post(
+                    f"{ASSEMBLYAI_BASE_URL}/transcript",
+                    headers=headers,
+                    json={"audio_url": audio_url, "language_code": "en_au"},
+                )
+            )
+            transcript_url = f"{ASSEMBLYAI_BASE_URL}/transcript/{created.json()['id']}"
 
-            return transcript.text or ""
+            deadline = time.monotonic() + ASSEMBLYAI_TIMEOUT_S
+            while True:
+                poll = await _request_with_retry(
+                    lambda: client.get(transcript_url, headers=headers)
+                )
+                data = poll.json()
+                status = data.get("status")
+                if status == "completed":
+                    self._record_success()
+                    return data.get("text") or ""
+                if status == "error":
+                    self._record_success()
+                    logger.error("AssemblyAI error: %s", data.get("error"))
+                    return ""
+                if time.monotonic() >= deadline:
+                    raise ProviderTimeoutError(
+                        f"no result after {ASSEMBLYAI_TIMEOUT_S}s"
+                    )
+                await asyncio.sleep(ASSEMBLYAI_POLL_INTERVAL_S)
         except Exception as exc:
+            self._record_error(exc)
             logger.error("AssemblyAI transcription failed: %s", exc)
             return ""
 
     @classmethod
-    def from_env(cls) -> "AssemblyAIService":
+    def from_env(
+        cls, http_client: Optional[httpx.AsyncClient] = None
+    ) -> "AssemblyAIService":
         """Create AssemblyAIService from environment variables."""
-        return cls()
+        return cls(http_client=http_client)
 
 
 class OpenAIAudioService:
@@ -185,41 +458,59 @@ class OpenAIAudioService:
         sample_rate: int = 16000,
         channels: int = 1,
         model: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize OpenAI Audio service.
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            http_client: Optional shared HTTP client (defaults to the module pool)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.sample_rate = sample_rate
         self.channels = channels
         self.model = model or os.getenv("OPENAI_TRANSCRIBE_MODEL", "gpt-4o-transcribe")
+        self.http_client = http_client
+        self._client = None
         self.enabled = bool(self.api_key)
         if not self.enabled:
             logger.warning("OpenAIAudioService disabled (OPENAI_API_KEY missing)")
 
-    async def transcribe(self, audio_bytes: bytes) -> str:
+    def _get_client(self):
+        """Build the AsyncOpenAI client once, on the shared connection pool."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self.http_client or get_shared_http_client(),
+            )
+        return self._client
+
+    async def transcribe(
+        self, audio_bytes: bytes, wav_bytes: Optional[bytes] = None
+    ) -> str:
         """
         Transcribe audio to text using GPT-4o-audio.
 
         Args:
             audio_bytes: Raw audio data (16kHz, PCM16)
+            wav_bytes: Optional pre-encoded WAV of `audio_bytes` (skips encoding)
 
         Returns:
             Transcribed text (empty string if not configured)
         """
         if not self.enabled:
             return ""
+        if _is_too_short(audio_bytes, self.sample_rate, self.channels):
+            return ""
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=self.api_key)
-            wav_bytes = _pcm_to_wav_bytes(
-                audio_bytes, sample_rate=self.sample_rate, channels=self.channels
-            )
+            client = self._get_client()
+            if wav_bytes is None:
+                wav_bytes = _pcm_to_wav_bytes(audio_bytes, self.sample_rate, self.channels)
+            # BytesIO shares the immutable buffer rather than copying it again.
             audio_file = io.BytesIO(wav_bytes)
             audio_file.name = "audio.wav"
 
@@ -234,6 +525,95 @@ class OpenAIAudioService:
             return ""
 
     @classmethod
-    def from_env(cls) -> "OpenAIAudioService":
+    def from_env(
+        cls, http_client: Optional[httpx.AsyncClient] = None
+    ) -> "OpenAIAudioService":
         """Create OpenAIAudioService from environment variables."""
-        return cls()
+        return cls(http_client=http_client)
+
+
+def _provider_identity(service) -> Tuple[str, ...]:
+    """
+    Stable cache identity for a service: provider class plus the settings that
+    change its output. Services are built per call, so keying on the instance
+    would never match across calls (and would keep the instance alive).
+    """
+    return (
+        type(service).__name__,
+        str(getattr(service, "model", "")),
+        str(getattr(service, "language", "")),
+    )
+
+
+async def _transcribe_coalesced(
+    service, audio_bytes: bytes, wav_bytes: bytes, digest: bytes
+) -> str:
+    key = (_provider_identity(service), digest)
+    now = time.monotonic()
+    cached = _recent_results.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            return cached[1]
+        del _recent_results[key]
+
+    future = _inflight.get(key)
+    if future is not None:
+        return await asyncio.shield(future)
+
+    future = asyncio.ensure_future(service.transcribe(audio_bytes, wav_bytes=wav_bytes))
+    _inflight[key] = future
+    try:
+        text = await asyncio.shield(future)
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+    if text:
+        _recent_results[key] = (time.monotonic() + RESULT_CACHE_TTL_S, text)
+        if len(_recent_results) > RESULT_CACHE_MAX_ENTRIES:
+            _recent_results.popitem(last=False)
+    return text
+
+
+async def transcribe_all(
+    audio_bytes: bytes,
+    services: Sequence,
+    sample_rate: int = 16000,
+    channels: int = 1,
+) -> List[str]:
+    """
+    Transcribe the same audio with every service concurrently.
+
+    The WAV payload is encoded once and shared by all services. Duplicate
+    requests for byte-identical audio are coalesced per provider (class,
+    model and language), so they also match across calls.
+
+    Args:
+        audio_bytes: Raw audio data (PCM16)
+        services: ASR services exposing ``async transcribe(audio_bytes, wav_bytes=...)``
+        sample_rate: Sample rate of `audio_bytes`
+        channels: Channel count of `audio_bytes`
+
+    Returns:
+        One transcript per service, in order ("" for failures)
+    """
+    if _is_too_short(audio_bytes, sample_rate, channels):
+        return [""] * len(services)
+
+    wav_bytes = _pcm_to_wav_bytes(audio_bytes, sample_rate, channels)
+    digest = hashlib.blake2b(wav_bytes, digest_size=16).digest()
+    results = await asyncio.gather(
+        *(
+            _transcribe_coalesced(service, audio_bytes, wav_bytes, digest)
+            for service in services
+        ),
+        return_exceptions=True,
+    )
+    transcripts: List[str] = []
+    for service, result in zip(services, results):
+        if isinstance(result, BaseException):
+            logger.error("%s transcription failed: %s", type(service).__name__, result)
+            transcripts.append("")
+        else:
+            transcripts.append(result)
+    return transcripts
@@ -2,20 +2,55 @@
 "Call initiator service for triggering the bot runner start_call endpoint."
 "\"\"\""
 
+import json
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson (optional dependency, faster payload encoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 BOT_RUNNER_URL = os.getenv("BOT_RUNNER_URL", "http://localhost:8000").rstrip("/")
 DEFAULT_SYSTEM_PROMPT = os.getenv(
     "DEFAULT_SYSTEM_PROMPT",
     "You are a helpful AI assistant for SpotFunnel."
 )
 
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive client used to reach the bot runner."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _http_client
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+async def close_http_client() -> None:
+    """Close the bot runner HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
 
 async def start_bot_call(
     call_sid: str,
@@ -45,19 +80,23 @@ async def start_bot_call(
     endpoint = f"{BOT_RUNNER_URL}/start_call"
 
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=5.0)) as client:
-            response = await client.post(endpoint, json=request_payload)
-            if response.status_code == 200:
-                logger.info("Triggered start_call for CallSid=%s", call_sid)
-                return True
-
-            logger.error(
-                "start_call failed for CallSid=%s status=%s body=%s",
-                call_sid,
-                response.status_code,
-                response.text,
-            )
-            return False
+        client = get_http_client()
+        response = await client.post(
+            endpoint,
+            content=_encode_payload(request_payload),
+            headers={"Content-Type": "application/json"},
+        )
+        if response.status_code == 200:
+            logger.info("Triggered start_call for CallSid=%s", call_sid)
+            return True
+
+        logger.error(
+            "start_call failed for CallSid=%s status=%s body=%s",
+            call_sid,
+            response.status_code,
+            response.text,
+        )
+        return False
 
     except Exception as exc:
         logger.exception("Error calling start_call: %s", exc)
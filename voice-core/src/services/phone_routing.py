@@ -5,43 +5,225 @@
 import asyncio
 import json
 import logging
-import re
-from typing import Any, Dict, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from psycopg2.extras import RealDictCursor
 
-from ..database.db_service import get_db_service
+# Try to import orjson (optional dependency, faster JSON parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..database.db_service import get_db_service, run_in_db_executor
+from ..utils.phone_utils import normalize_phone_number
 
 logger = logging.getLogger(__name__)
 
+ROUTING_CACHE_TTL_S = 60
+ROUTING_CACHE_MAX_ENTRIES = 1024
+ROUTING_TABLE_REFRESH_S = float(os.getenv("PHONE_ROUTING_REFRESH_SECONDS", "300"))
+# Sent by the phone_routing trigger (migration 015) with the changed number
+ROUTING_NOTIFY_CHANNEL = "phone_routing_changed"
+
+# Routing and tenant config change rarely; cache hits skip both the DB query
+# and the executor hop on call setup. Only touched from the event loop.
+_phone_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_config_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: str) -> Any:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return entry[1]
 
-def normalize_phone_number(phone: str) -> str:
+
+def _cache_put(cache: OrderedDict, key: str, value: Any) -> None:
+    cache[key] = (time.monotonic() + ROUTING_CACHE_TTL_S, value)
+    cache.move_to_end(key)
+    if len(cache) > ROUTING_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+class PhoneRoutingCache:
     """
-    Normalize phone number to E.164 format for matching.
+    In-memory copy of the (small) phone_routing table.
+
+    Loaded at startup and kept current by LISTEN phone_routing_changed
+    (migration 015): each notification drops the changed number and reloads
+    the table. It is also reloaded every ROUTING_TABLE_REFRESH_S seconds, or
+    every ROUTING_CACHE_TTL_S while the listener is down, so a route is never
+    staler than the DB-miss cache allows. Misses still fall back to the DB.
     """
-    digits = re.sub(r"[^\d+]", "", phone)
-    if not digits:
-        return phone
 
-    if not digits.startswith("+"):
-        if digits.startswith("61"):
-            digits = f"+{digits}"
-        elif digits.startswith("0"):
-            digits = f"+61{digits[1:]}"
-        else:
-            digits = f"+{digits}"
+    def __init__(self, refresh_interval_s: float = ROUTING_TABLE_REFRESH_S):
+        self.refresh_interval_s = refresh_interval_s
+        self._routes: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        self._listen_conn = None
+        self._listen_fd: Optional[int] = None
+        # Bumped per notification; a load that overlaps one is discarded
+        self._generation = 0
+
+    def get(self, normalized_phone: str) -> Optional[str]:
+        return self._routes.get(normalized_phone)
+
+    def discard_tenant(self, tenant_id: str) -> None:
+        self._routes = {p: t for p, t in self._routes.items() if t != tenant_id}
+
+    def discard_phone(self, normalized_phone: str) -> None:
+        self._routes.pop(normalized_phone, None)
+        _phone_cache.pop(normalized_phone, None)
+
+    async def refresh(self) -> None:
+        generation = self._generation
+        try:
+            routes = await run_in_db_executor(_load_all_routes)
+        except Exception as exc:
+            logger.error("Phone routing cache refresh failed: %s", exc)
+            return
+        if generation != self._generation:
+            # A route changed mid-load; the reload it triggered applies it
+            return
+        self._routes = routes
+        logger.info("Phone routing cache loaded (%d numbers)", len(self._routes))
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        for task in (self._task, self._reload_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._reload_task = None
+        self._close_listener()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            if self._listen_conn is None:
+                await self._start_listener()
+            await self.refresh()
+            if self._listen_conn is not None:
+                await asyncio.sleep(self.refresh_interval_s)
+            else:
+                await asyncio.sleep(min(self.refresh_interval_s, ROUTING_CACHE_TTL_S))
+
+    async def _start_listener(self) -> None:
+        try:
+            conn = await run_in_db_executor(_open_listen_connection)
+        except Exception as exc:
+            logger.warning(
+                "Phone routing LISTEN unavailable, reloading every %ss: %s",
+                ROUTING_CACHE_TTL_S,
+                exc,
+            )
+            return
+        self._listen_conn = conn
+        self._listen_fd = conn.fileno()
+        asyncio.get_running_loop().add_reader(self._listen_fd, self._on_listen_readable)
+
+    def _close_listener(self) -> None:
+        conn, self._listen_conn = self._listen_conn, None
+        if conn is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._listen_fd)
+        self._listen_fd = None
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _on_listen_readable(self) -> None:
+        conn = self._listen_conn
+        try:
+            conn.poll()
+        except Exception as exc:
+            logger.error("Phone routing listener lost: %s", exc)
+            self._close_listener()
+            return
+        changed = [notify.payload for notify in conn.notifies]
+        conn.notifies.clear()
+        self._apply_changes(changed)
+
+    def _apply_changes(self, changed_phones: List[str]) -> None:
+        if not changed_phones:
+            return
+        self._generation += 1
+        for phone in changed_phones:
+            self.discard_phone(phone)
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.create_task(self._reload_after_changes())
 
-    return digits
+    async def _reload_after_changes(self) -> None:
+        generation = None
+        while generation != self._generation:
+            generation = self._generation
+            await self.refresh()
+
+
+def _open_listen_connection():
+    conn = psycopg2.connect(get_db_service().db_url)
+    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    with conn.cursor() as cur:
+        cur.execute(f"LISTEN {ROUTING_NOTIFY_CHANNEL}")
+    return conn
+
+
+_routing_table: Optional[PhoneRoutingCache] = None
+
+
+def get_phone_routing_cache() -> PhoneRoutingCache:
+    """Get global phone routing cache instance."""
+    global _routing_table
+    if _routing_table is None:
+        _routing_table = PhoneRoutingCache()
+    return _routing_table
+
+
+def invalidate_tenant(tenant_id: str) -> None:
+    """Drop cached config and phone routes for a tenant (call after admin updates)."""
+    _config_cache.pop(tenant_id, None)
+    for phone in [p for p, (_, t) in _phone_cache.items() if t == tenant_id]:
+        del _phone_cache[phone]
+    get_phone_routing_cache().discard_tenant(tenant_id)
 
 
 async def resolve_phone_to_tenant(phone_number: str) -> Optional[str]:
     """
-    Look up tenant ID for an incoming phone number.
+    Look up tenant ID for an incoming phone number (cached for ROUTING_CACHE_TTL_S).
     """
     normalized = normalize_phone_number(phone_number)
-    logger.info("Resolving phone routing: %s → %s", phone_number, normalized)
+    routed = get_phone_routing_cache().get(normalized)
+    if routed is not None:
+        return routed
 
-    return await asyncio.to_thread(_query_phone_routing, normalized)
+    cached = _cache_get(_phone_cache, normalized)
+    if cached is not None:
+        return cached
+
+    logger.info("Resolving phone routing: %s → %s", phone_number, normalized)
+    tenant_id = await run_in_db_executor(_query_phone_routing, normalized)
+    if tenant_id is not None:
+        _cache_put(_phone_cache, normalized, tenant_id)
+    return tenant_id
 
 
 def _query_phone_routing(normalized_phone: str) -> Optional[str]:
@@ -49,10 +231,7 @@ def _query_phone_routing(normalized_phone: str) -> Optional[str]:
     conn = db.get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT tenant_id FROM phone_routing WHERE phone_number = %s",
-                (normalized_phone,),
-            )
+            cur.execute(db.lookup_query(conn, "phone_routing_lookup"), (normalized_phone,))
             row = cur.fetchone()
             if row:
                 logger.info("Phone %s routed to tenant %s", normalized_phone, row[0])
@@ -66,11 +245,30 @@ def _query_phone_routing(normalized_phone: str) -> Optional[str]:
         db.put_connection(conn)
 
 
+def _load_all_routes() -> Dict[str, str]:
+    db = get_db_service()
+    conn = db.get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT phone_number, tenant_id FROM phone_routing")
+            return {phone: tenant_id for phone, tenant_id in cur.fetchall()}
+    finally:
+        db.put_connection(conn)
+
+
 async def get_tenant_config(tenant_id: str) -> Optional[Dict[str, Any]]:
     """
-    Load tenant configuration for a given tenant.
+    Load tenant configuration for a given tenant (cached for ROUTING_CACHE_TTL_S).
     """
-    return await asyncio.to_thread(_load_tenant_config, tenant_id)
+    # Callers add per-call keys (caller_phone, ...), so hand out shallow copies.
+    cached = _cache_get(_config_cache, tenant_id)
+    if cached is not None:
+        return dict(cached)
+
+    config = await run_in_db_executor(_load_tenant_config, tenant_id)
+    if config is not None:
+        _cache_put(_config_cache, tenant_id, dict(config))
+    return config
 
 
 def _load_tenant_config(tenant_id: str) -> Optional[Dict[str, Any]]:
@@ -78,20 +276,7 @@ def _load_tenant_config(tenant_id: str) -> Optional[Dict[str, Any]]:
     conn = db.get_connection()
     try:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT
-                    t.locale,
-                    t.metadata,
-                    t.system_prompt,
-                    t.agent_role,
-                    t.agent_personality,
-                    t.greeting_message
-                FROM tenants t
-                WHERE t.tenant_id = %s
-                """,
-                (tenant_id,),
-            )
+            cur.execute(db.lookup_query(conn, "tenant_config_lookup"), (tenant_id,))
             row = cur.fetchone()
             if not row:
                 logger.warning("Tenant config not found for %s", tenant_id)
@@ -108,6 +293,8 @@ def _load_tenant_config(tenant_id: str) -> Optional[Dict[str, Any]]:
                 "agent_role": row.get("agent_role", "receptionist"),
                 "agent_personality": row.get("agent_personality", "friendly"),
                 "greeting_message": row.get("greeting_message"),
+                # Joined in the same query so outbound/fallback paths need no second lookup
+                "telephony": _deserialize_json_field(row.get("telephony")) or {},
             }
     except Exception as exc:
         logger.exception("Failed to load tenant config: %s", exc)
@@ -122,6 +309,8 @@ def _deserialize_json_field(value: Any) -> Any:
     if isinstance(value, (dict, list)):
         return value
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(value)
         return json.loads(value)
     except (TypeError, ValueError):
         logger.warning("Unable to parse JSON field: %s", value)
@@ -5,22 +5,29 @@ Prompt service for Layer 1 + Layer 2 prompt composition with caching.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Any
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
 
 from psycopg2.extras import RealDictCursor, Json
 
 from ..database.db_service import get_db_service
-from ..prompts.knowledge_combiner import combine_prompts
+from ..prompts.knowledge_combiner import build_system_prompt
 
 logger = logging.getLogger(__name__)
 
+LAYER_2_CACHE_MAX_ENTRIES = 1024
+LAYER_2_CACHE_TTL_S = 300
+
 
 class PromptService:
     """Manages Layer 1 + Layer 2 prompt combination with in-memory caching."""
 
     def __init__(self, db_service=None):
         self.db = db_service or get_db_service()
-        self._cache: Dict[str, Optional[str]] = {}
+        # tenant_id -> (expires_at, layer_2). Bounded LRU with a TTL so writes
+        # from other processes are picked up within LAYER_2_CACHE_TTL_S.
+        self._cache: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
 
     def get_system_prompt(
         self,
@@ -38,29 +45,32 @@ class PromptService:
             Combined system prompt string.
         """
         layer_2 = self._get_layer_2_cached(tenant_id)
-        return combine_prompts(
-            static_knowledge=static_knowledge,
-            layer2_system_prompt=layer_2,
-        )
+        return build_system_prompt(layer_2, static_knowledge)
 
     def _get_layer_2_cached(self, tenant_id: str) -> Optional[str]:
-        if tenant_id not in self._cache:
-            layer_2 = self._fetch_active_layer_2(tenant_id)
-            self._cache[tenant_id] = layer_2
-        return self._cache[tenant_id]
+        now = time.monotonic()
+        entry = self._cache.get(tenant_id)
+        if entry is not None and entry[0] > now:
+            self._cache.move_to_end(tenant_id)
+            return entry[1]
+
+        layer_2 = self._fetch_active_layer_2(tenant_id)
+        self._cache[tenant_id] = (now + LAYER_2_CACHE_TTL_S, layer_2)
+        self._cache.move_to_end(tenant_id)
+        if len(self._cache) > LAYER_2_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return layer_2
+
+    def _invalidate(self, tenant_id: str) -> None:
+        self._cache.pop(tenant_id, None)
 
     def _fetch_active_layer_2(self, tenant_id: str) -> Optional[str]:
-        query = """
-            SELECT layer_2_content
-            FROM prompts
-            WHERE tenant_id = %s AND is_active = true
-            ORDER BY version DESC
-            LIMIT 1
-        """
         conn = self.db.get_connection()
         try:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, (tenant_id,))
+                cur.execute(
+                    self.db.lookup_query(conn, "active_layer_2_lookup"), (tenant_id,)
+                )
                 row = cur.fetchone()
                 if row:
                     return row.get("layer_2_content")
@@ -87,23 +97,22 @@ class PromptService:
         conn = self.db.get_connection()
         try:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                # One round trip: compute the next version, deactivate the
+                # current row and insert the new one atomically. Reading
+                # `deactivated` forces the UPDATE to run before the INSERT,
+                # which the one-active-per-tenant unique index requires.
                 cur.execute(
                     """
-                    SELECT COALESCE(MAX(version), 0) + 1 AS next_version
-                    FROM prompts
-                    WHERE tenant_id = %s
-                    """,
-                    (tenant_id,),
-                )
-                next_version = cur.fetchone()["next_version"]
-
-                cur.execute(
-                    "UPDATE prompts SET is_active = false WHERE tenant_id = %s",
-                    (tenant_id,),
-                )
-
-                cur.execute(
-                    """
+                    WITH next AS (
+                        SELECT COALESCE(MAX(version), 0) + 1 AS version
+                        FROM prompts
+                        WHERE tenant_id = %s
+                    ), deactivated AS (
+                        UPDATE prompts
+                        SET is_active = false
+                        WHERE tenant_id = %s AND is_active
+                        RETURNING 1
+                    )
                     INSERT INTO prompts (
                         tenant_id,
                         version,
@@ -111,16 +120,21 @@ class PromptService:
                         is_active,
                         created_by,
                         metadata
-                    ) VALUES (%s, %s, %s, true, %s, %s)
+                    )
+                    SELECT %s, next.version, %s, true, %s, %s
+                    FROM next, (SELECT COUNT(*) FROM deactivated) AS d
+                    RETURNING version
                     """,
                     (
                         tenant_id,
-                        next_version,
+                        tenant_id,
+                        tenant_id,
                         content,
                         created_by,
                         Json(metadata or {}),
                     ),
                 )
+                next_version = cur.fetchone()["version"]
                 conn.commit()
         except Exception as exc:
             conn.rollback()
@@ -129,7 +143,7 @@ class PromptService:
         finally:
             self.db.put_connection(conn)
 
-        self._cache.pop(tenant_id, None)
+        self._invalidate(tenant_id)
         logger.info("Updated Layer 2 for tenant %s to version %s", tenant_id, next_version)
         return next_version
 
@@ -138,17 +152,22 @@ class PromptService:
         conn = self.db.get_connection()
         try:
             with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE prompts SET is_active = false WHERE tenant_id = %s",
-                    (tenant_id,),
-                )
+                # Touch only the currently active row and the target, and
+                # deactivate first so the unique index never sees two actives.
                 cur.execute(
                     """
+                    WITH deactivated AS (
+                        UPDATE prompts
+                        SET is_active = false
+                        WHERE tenant_id = %s AND is_active AND version <> %s
+                        RETURNING 1
+                    )
                     UPDATE prompts
                     SET is_active = true
                     WHERE tenant_id = %s AND version = %s
+                      AND (SELECT COUNT(*) FROM deactivated) >= 0
                     """,
-                    (tenant_id, version),
+                    (tenant_id, version, tenant_id, version),
                 )
                 conn.commit()
         except Exception as exc:
@@ -158,5 +177,5 @@ class PromptService:
         finally:
             self.db.put_connection(conn)
 
-        self._cache.pop(tenant_id, None)
+        self._invalidate(tenant_id)
         logger.info("Rolled back tenant %s to prompt version %s", tenant_id, version)
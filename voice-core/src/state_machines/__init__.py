@@ -2,8 +2,25 @@
 State machines for objective execution (Layer 1)
 
 Provides deterministic state management for capture primitives.
+
+Exports are imported lazily (PEP 562) so importing the package does not load
+the state machine until it is actually used.
 """
 
-from .objective_state import ObjectiveState, ObjectiveStateMachine
+import importlib
+
+_LAZY_IMPORTS = {
+    "ObjectiveState": ".objective_state",
+    "ObjectiveStateMachine": ".objective_state",
+}
 
 __all__ = ["ObjectiveState", "ObjectiveStateMachine"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -8,9 +8,7 @@ Configured for Australian timezone (AEST/AEDT).
 import os
 import asyncio
 from typing import Optional
-from datetime import datetime
 import logging
-import pytz
 
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.audio.vad.silero import SileroVADAnalyzer
@@ -18,6 +16,7 @@ from pipecat.transports.services.daily import DailyParams, DailyTransport
 
 from events.event_emitter import EventEmitter
 from transports.smart_turn_config import SmartTurnConfig
+from utils.time_utils import SYDNEY_TZ, iso_now_sydney
 
 logger = logging.getLogger(__name__)
 
@@ -84,14 +83,14 @@ class DailyTransportWrapper:
         self.transport.vad_analyzer = vad_analyzer
         
         # Australian timezone
-        self.timezone = pytz.timezone("Australia/Sydney")
+        self.timezone = SYDNEY_TZ
         
     async def start(self):
         """Emit call_started event (transport is managed by PipelineRunner)"""
         if self.event_emitter:
             await self.event_emitter.emit("call_started", {
                 "room_url": self.room_url,
-                "timestamp": datetime.now(self.timezone).isoformat(),
+                "timestamp": iso_now_sydney(),
                 "timezone": "Australia/Sydney"
             })
     
@@ -100,7 +99,7 @@ class DailyTransportWrapper:
         if self.event_emitter:
             await self.event_emitter.emit("call_ended", {
                 "room_url": self.room_url,
-                "timestamp": datetime.now(self.timezone).isoformat(),
+                "timestamp": iso_now_sydney(),
             })
     
     def input(self):
@@ -0,0 +1,210 @@
+"""
+Shared Silero VAD ONNX session for telephony transports.
+
+pipecat's SileroVADAnalyzer always loads its bundled FP32 model with default
+graph optimisation and spinning ORT worker threads. On a call worker serving
+many calls we want a single thread per session that sleeps between 20ms
+frames, and the option to point at an int8-quantized export of the model.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from importlib import resources
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Optional override, e.g. an int8 dynamic-quantized Silero v5 export
+SILERO_VAD_MODEL_PATH = os.getenv("SILERO_VAD_MODEL_PATH")
+
+SILERO_VAD_BATCHING = os.getenv("SILERO_VAD_BATCHING", "true").lower() == "true"
+SILERO_VAD_BATCH_MAX = int(os.getenv("SILERO_VAD_BATCH_MAX", "32"))
+# Extra time the dispatcher waits to fill a batch; 0 only coalesces frames
+# that are already queued, so a lone call pays no added latency.
+SILERO_VAD_BATCH_WAIT_S = float(os.getenv("SILERO_VAD_BATCH_WAIT_MS", "0")) / 1000
+
+_STATE_SHAPE = (2, 1, 128)
+_SR_TENSORS = {sr: np.array(sr, dtype=np.int64) for sr in (8000, 16000)}
+
+
+def _default_model_path() -> str:
+    return str(resources.files("pipecat.audio.vad.data").joinpath("silero_vad.onnx"))
+
+
+def build_silero_session(model_path: Optional[str] = None):
+    """Create a single-threaded, fully optimised CPU session for the Silero model."""
+    import onnxruntime as ort
+
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Frames arrive every 20ms; don't let idle ORT threads spin on a core
+    opts.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+
+    return ort.InferenceSession(
+        model_path or SILERO_VAD_MODEL_PATH or _default_model_path(),
+        sess_options=opts,
+        providers=["CPUExecutionProvider"],
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_silero_session(model_path: Optional[str] = None):
+    """
+    Process-wide Silero session.
+
+    InferenceSession.run() is thread-safe and all recurrent state lives in
+    SileroSessionModel, so every call shares one loaded graph instead of
+    paying session init and model memory per call.
+    """
+    return build_silero_session(model_path)
+
+
+_BatchItem = Tuple[np.ndarray, np.ndarray, int, Future]
+
+
+class SileroBatcher:
+    """
+    Coalesces concurrent single-stream Silero calls into batched session runs.
+
+    pipecat calls the VAD from one executor thread per transport, so frames
+    from concurrent calls arrive on different threads. Each caller queues its
+    (input, state) pair and blocks on a future; a dispatcher thread stacks
+    whatever is pending into one (B, samples) / (2, B, 128) run and hands
+    each caller its slice of the output and new state.
+    """
+
+    def __init__(
+        self,
+        session,
+        max_batch: int = SILERO_VAD_BATCH_MAX,
+        max_wait_s: float = SILERO_VAD_BATCH_WAIT_S,
+    ):
+        self.session = session
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self._queue: "queue.SimpleQueue[_BatchItem]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def infer(self, x: np.ndarray, state: np.ndarray, sr: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self._thread is None:
+            self._start()
+        future: Future = Future()
+        self._queue.put((x, state, sr, future))
+        return future.result()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch_loop, name="silero-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_s
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_rate = {}
+            for item in batch:
+                by_rate.setdefault(item[2], []).append(item)
+            for sr, items in by_rate.items():
+                self._run_batch(sr, items)
+
+    def _run_batch(self, sr: int, items: List[_BatchItem]) -> None:
+        try:
+            out, state = self.session.run(
+                None,
+                {
+                    "input": np.concatenate([item[0] for item in items], axis=0),
+                    "state": np.concatenate([item[1] for item in items], axis=1),
+                    "sr": _SR_TENSORS[sr],
+                },
+            )
+        except Exception as exc:
+            for item in items:
+                item[3].set_exception(exc)
+            return
+
+        for i, item in enumerate(items):
+            item[3].set_result((out[i : i + 1], state[:, i : i + 1]))
+
+
+@lru_cache(maxsize=None)
+def get_shared_silero_batcher(model_path: Optional[str] = None) -> SileroBatcher:
+    """Process-wide batcher over the shared Silero session."""
+    return SileroBatcher(get_shared_silero_session(model_path))
+
+
+class SileroSessionModel:
+    """
+    Recurrent Silero state for one audio stream around an ONNX session.
+
+    Drop-in replacement for pipecat's SileroOnnxModel (same call signature and
+    reset_states()), limited to the single-stream 8kHz/16kHz case. With a
+    batcher, inference is coalesced with other streams on the same session.
+
+    The (1, context + samples) model input is allocated once per stream: each
+    frame shifts the previous tail into the context slot and writes the new
+    samples after it, instead of concatenating a fresh array every 20ms.
+    """
+
+    def __init__(self, session, batcher: Optional[SileroBatcher] = None):
+        self.session = session
+        self.batcher = batcher
+        self.sample_rates = [8000, 16000]
+        self.reset_states()
+
+    def reset_states(self, batch_size: int = 1):
+        self._state = np.zeros(_STATE_SHAPE, dtype=np.float32)
+        self._input: Optional[np.ndarray] = None
+        self._last_sr = 0
+
+    def __call__(self, x, sr: int):
+        if sr not in self.sample_rates:
+            raise ValueError(f"Supported sampling rates: {self.sample_rates}")
+
+        num_samples = 512 if sr == 16000 else 256
+        context_size = 64 if sr == 16000 else 32
+        x = np.asarray(x, dtype=np.float32).reshape(1, -1)
+        if x.shape[1] != num_samples:
+            raise ValueError(
+                f"Provided number of samples is {x.shape[1]} "
+                "(Supported values: 256 for 8000 sample rate, 512 for 16000)"
+            )
+
+        if self._last_sr and self._last_sr != sr:
+            self.reset_states()
+        if self._input is None:
+            self._input = np.zeros((1, context_size + num_samples), dtype=np.float32)
+        else:
+            self._input[:, :context_size] = self._input[:, -context_size:]
+        self._input[:, context_size:] = x
+
+        # Safe to reuse: the batcher copies it into the batch before returning
+        if self.batcher is not None:
+            out, self._state = self.batcher.infer(self._input, self._state, sr)
+        else:
+            out, self._state = self.session.run(
+                None,
+                {"input": self._input, "state": self._state, "sr": _SR_TENSORS[sr]},
+            )
+        self._last_sr = sr
+        return out
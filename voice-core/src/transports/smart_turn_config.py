@@ -12,9 +12,11 @@ Upstream: https://github.com/pipecat-ai/smart-turn
 
 import os
 import inspect
+from functools import lru_cache
 from typing import Optional, Type
 
 
+@lru_cache(maxsize=1)
 def _load_smart_turn_class() -> Type[object]:
     from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (
         LocalSmartTurnAnalyzerV3,
@@ -23,6 +25,11 @@ def _load_smart_turn_class() -> Type[object]:
     return LocalSmartTurnAnalyzerV3
 
 
+@lru_cache(maxsize=8)
+def _accepts_cpu_count(smart_turn_class: Type[object]) -> bool:
+    return "cpu_count" in inspect.signature(smart_turn_class).parameters
+
+
 class SmartTurnConfig:
     """Configuration for Smart Turn V3 turn detection."""
 
@@ -55,25 +62,24 @@ class SmartTurnConfig:
         Create Smart Turn V3 analyzer if enabled.
 
         Args:
-            sample_rate: Audio sample rate (Smart Turn requires 16kHz)
+            sample_rate: Audio sample rate (Smart Turn requires 16kHz; Pipecat
+                resamples 8kHz telephony audio before it reaches the analyzer)
 
         Returns:
             LocalSmartTurnAnalyzerV3 instance if enabled, None otherwise
         """
+        # Env is read per call so SMART_TURN_ENABLED can be flipped without a
+        # restart; the import and signature check are cached.
         config = cls.from_env()
 
         if not config["enabled"]:
             return None
 
-        if sample_rate != 16000:
-            # Smart Turn requires 16kHz; Pipecat handles resampling when needed.
-            pass
-
         smart_turn_class = _load_smart_turn_class()
         params = {
             "smart_turn_model_path": config["model_path"],
             "sample_rate": sample_rate,
         }
-        if "cpu_count" in inspect.signature(smart_turn_class).parameters:
+        if _accepts_cpu_count(smart_turn_class):
             params["cpu_count"] = config["cpu_count"]
         return smart_turn_class(**params)
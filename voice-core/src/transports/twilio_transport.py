@@ -10,25 +10,35 @@ Reference: production-failure-prevention.md - "Audio Encoding Mismatches"
 
 import os
 import asyncio
-from typing import Optional, Dict, Any
-from datetime import datetime
+import importlib.util
+from dataclasses import asdict, dataclass
+from typing import Optional, Dict, Any, Set
 import logging
-import pytz
 
-try:
+
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):  # parent package missing or stubbed
+        return False
+
+
+# Pinned pipecat ships no Twilio transport; check before importing so module
+# load doesn't pay for a failed import (and unrelated errors aren't swallowed).
+if _module_available("pipecat.transports.services.twilio"):
     from pipecat.transports.services.twilio import TwilioTransport
-except Exception:  # pragma: no cover - optional dependency
+else:  # pragma: no cover - optional dependency
     TwilioTransport = None
 
 from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 
 from events.event_emitter import EventEmitter
 from transports.smart_turn_config import SmartTurnConfig
+from transports.vad_prefilter import TwoStageVADAnalyzer
+from utils.time_utils import SYDNEY_TZ, iso_now_sydney
 
 logger = logging.getLogger(__name__)
 
-
 class _StubTwilioTransport:
     def __init__(self, *args, **kwargs):
         self._error = "pipecat TwilioTransport is not available in this environment."
@@ -45,6 +55,78 @@ class AudioEncodingMismatchError(Exception):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class AudioEncoding:
+    """Audio format for a provider/transport pair (subscriptable like the old dict)."""
+
+    encoding: str
+    sample_rate: int
+    channels: int
+    provider: str
+    transport: str
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def check_audio_encoding(transport_type: str, encoding: AudioEncoding) -> None:
+    """
+    Check an encoding against Twilio's requirements for `transport_type`
+    (plain dicts with the same keys are also accepted).
+    
+    Raises:
+        AudioEncodingMismatchError: If encoding requirements not met, or the
+            transport type has no known requirements
+    """
+    # Validate Twilio PSTN requirements
+    if transport_type == "pstn":
+        if encoding["encoding"] != "mulaw":
+            raise AudioEncodingMismatchError(
+                f"Twilio PSTN requires mulaw encoding, got {encoding['encoding']}. "
+                "This will cause garbled audio. Fix: Set encoding='mulaw'"
+            )
+        
+        if encoding["sample_rate"] != 8000:
+            raise AudioEncodingMismatchError(
+                f"Twilio PSTN requires 8kHz sample rate, got {encoding['sample_rate']}Hz. "
+                "This will cause garbled audio. Fix: Set sample_rate=8000"
+            )
+    
+    # Validate Twilio WebRTC requirements (if implemented)
+    elif transport_type == "webrtc":
+        if encoding["encoding"] != "pcm":
+            raise AudioEncodingMismatchError(
+                f"Twilio WebRTC requires PCM encoding, got {encoding['encoding']}"
+            )
+        
+        if encoding["sample_rate"] != 16000:
+            raise AudioEncodingMismatchError(
+                f"Twilio WebRTC requires 16kHz sample rate, got {encoding['sample_rate']}Hz"
+            )
+    
+    else:
+        raise AudioEncodingMismatchError(
+            f"No Twilio audio encoding requirements for transport type: {transport_type}"
+        )
+
+
+# Reference: research/04.5-telephony-infrastructure.md
+AUDIO_ENCODINGS: Dict[str, AudioEncoding] = {
+    # Twilio PSTN requires mulaw 8kHz (non-negotiable)
+    "pstn": AudioEncoding("mulaw", 8000, 1, "twilio", "pstn"),
+    # Twilio WebRTC supports PCM 16kHz
+    "webrtc": AudioEncoding("pcm", 16000, 1, "twilio", "webrtc"),
+}
+
+# Fail at import, not on the first call, if a registry entry is ever wrong
+for _transport_type, _encoding in AUDIO_ENCODINGS.items():
+    check_audio_encoding(_transport_type, _encoding)
+del _transport_type, _encoding
+
+
 class TwilioTransportWrapper:
     """
     Wrapper around Pipecat's TwilioTransport with PSTN-specific configuration.
@@ -99,8 +181,9 @@ class TwilioTransportWrapper:
         
         # Configure VAD for Australian accent (250ms threshold)
         # Note: Barge-in requires 2-word minimum (handled at LLM layer)
+        # Silent PSTN frames are gated by an energy check before Silero runs.
         vad_params = VADParams(min_volume=0.6, stop_secs=0.25)
-        vad_analyzer = SileroVADAnalyzer(
+        vad_analyzer = TwoStageVADAnalyzer(
             sample_rate=self.audio_encoding["sample_rate"],
             params=vad_params,
         )
@@ -134,39 +217,38 @@ class TwilioTransportWrapper:
         )
         
         # Australian timezone
-        self.timezone = pytz.timezone("Australia/Sydney")
+        self.timezone = SYDNEY_TZ
         
         # Call metadata (for recording hooks)
         self.call_sid: Optional[str] = None
         self.call_metadata: Dict[str, Any] = {}
+        self._emit_tasks: Set[asyncio.Task] = set()
+        # Constant part of call_started; start() only adds call_sid + timestamp
+        self._call_started_base: Dict[str, Any] = {
+            "provider": "twilio",
+            "transport_type": self.transport_type,
+            "audio_encoding": self.audio_encoding.as_dict(),
+            "timezone": "Australia/Sydney",
+        }
         
-    def _get_audio_encoding(self) -> Dict[str, Any]:
+    def _get_audio_encoding(self) -> AudioEncoding:
         """
         Get audio encoding configuration based on transport type.
         
         Returns:
-            Dict with encoding, sample_rate, channels
+            Shared AudioEncoding with encoding, sample_rate, channels
+            
+        Raises:
+            AudioEncodingMismatchError: If transport_type has no registry entry
             
         Reference: research/04.5-telephony-infrastructure.md
         """
-        if self.transport_type == "pstn":
-            # Twilio PSTN requires mulaw 8kHz (non-negotiable)
-            return {
-                "encoding": "mulaw",
-                "sample_rate": 8000,
-                "channels": 1,
-                "provider": "twilio",
-                "transport": "pstn"
-            }
-        elif self.transport_type == "webrtc":
-            # Twilio WebRTC supports PCM 16kHz
-            return {
-                "encoding": "pcm",
-                "sample_rate": 16000,
-                "channels": 1,
-                "provider": "twilio",
-                "transport": "webrtc"
-            }
+        try:
+            return AUDIO_ENCODINGS[self.transport_type]
+        except KeyError:
+            raise AudioEncodingMismatchError(
+                f"No audio encoding registered for transport type: {self.transport_type}"
+            ) from None
     
     def _validate_audio_encoding(self):
         """
@@ -178,33 +260,7 @@ class TwilioTransportWrapper:
         Raises:
             AudioEncodingMismatchError: If encoding requirements not met
         """
-        encoding = self.audio_encoding
-        
-        # Validate Twilio PSTN requirements
-        if self.transport_type == "pstn":
-            if encoding["encoding"] != "mulaw":
-                raise AudioEncodingMismatchError(
-                    f"Twilio PSTN requires mulaw encoding, got {encoding['encoding']}. "
-                    "This will cause garbled audio. Fix: Set encoding='mulaw'"
-                )
-            
-            if encoding["sample_rate"] != 8000:
-                raise AudioEncodingMismatchError(
-                    f"Twilio PSTN requires 8kHz sample rate, got {encoding['sample_rate']}Hz. "
-                    "This will cause garbled audio. Fix: Set sample_rate=8000"
-                )
-        
-        # Validate Twilio WebRTC requirements (if implemented)
-        elif self.transport_type == "webrtc":
-            if encoding["encoding"] != "pcm":
-                raise AudioEncodingMismatchError(
-                    f"Twilio WebRTC requires PCM encoding, got {encoding['encoding']}"
-                )
-            
-            if encoding["sample_rate"] != 16000:
-                raise AudioEncodingMismatchError(
-                    f"Twilio WebRTC requires 16kHz sample rate, got {encoding['sample_rate']}Hz"
-                )
+        check_audio_encoding(self.transport_type, self.audio_encoding)
     
     async def start(self, call_sid: Optional[str] = None):
         """
@@ -217,26 +273,36 @@ class TwilioTransportWrapper:
         await self.transport.start()
         
         if self.event_emitter:
-            await self.event_emitter.emit("call_started", {
+            self._emit_nonblocking("call_started", {
+                **self._call_started_base,
                 "call_sid": call_sid,
-                "provider": "twilio",
-                "transport_type": self.transport_type,
-                "audio_encoding": self.audio_encoding,
-                "timestamp": datetime.now(self.timezone).isoformat(),
-                "timezone": "Australia/Sydney"
+                "timestamp": iso_now_sydney(),
             })
     
     async def stop(self):
         """Stop the transport and emit call_ended event"""
         if self.event_emitter:
-            await self.event_emitter.emit("call_ended", {
+            self._emit_nonblocking("call_ended", {
                 "call_sid": self.call_sid,
                 "provider": "twilio",
-                "timestamp": datetime.now(self.timezone).isoformat(),
+                "timestamp": iso_now_sydney(),
             })
         
         await self.transport.stop()
     
+    def _emit_nonblocking(self, event_name: str, data: Dict[str, Any]):
+        """Emit event without blocking call setup/teardown on slow listeners."""
+        task = asyncio.create_task(self.event_emitter.emit(event_name, data))
+        self._emit_tasks.add(task)
+        task.add_done_callback(self._handle_emit_result)
+
+    def _handle_emit_result(self, task: asyncio.Task):
+        self._emit_tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception():
+            logger.warning("Twilio event emit failed: %s", task.exception())
+    
     def input(self):
         """Get transport input (for pipeline)"""
         return self.transport.input()
@@ -299,9 +365,9 @@ class TwilioTransportWrapper:
 
 
 def validate_audio_pipeline_compatibility(
-    telephony_encoding: Dict[str, Any],
-    stt_encoding: Dict[str, Any],
-    tts_encoding: Dict[str, Any]
+    telephony_encoding: AudioEncoding,
+    stt_encoding: AudioEncoding,
+    tts_encoding: AudioEncoding
 ):
     """
     Validate audio encoding compatibility across pipeline components.
@@ -313,20 +379,16 @@ def validate_audio_pipeline_compatibility(
         stt_encoding: Audio encoding expected by STT service
         tts_encoding: Audio encoding produced by TTS service
         
+        Plain dicts with the same keys are also accepted.
+        
     Raises:
         AudioEncodingMismatchError: If encodings are incompatible
         
     Reference: production-failure-prevention.md - "Audio Encoding Mismatches"
     """
-    # Extract encoding parameters
-    tel_enc = telephony_encoding["encoding"]
-    tel_rate = telephony_encoding["sample_rate"]
-    
-    stt_enc = stt_encoding["encoding"]
-    stt_rate = stt_encoding["sample_rate"]
-    
-    tts_enc = tts_encoding["encoding"]
-    tts_rate = tts_encoding["sample_rate"]
+    tel_enc, tel_rate = telephony_encoding["encoding"], telephony_encoding["sample_rate"]
+    stt_enc, stt_rate = stt_encoding["encoding"], stt_encoding["sample_rate"]
+    tts_enc, tts_rate = tts_encoding["encoding"], tts_encoding["sample_rate"]
     
     # Check encoding compatibility
     if not (tel_enc == stt_enc == tts_enc):
@@ -0,0 +1,79 @@
+"""
+Two-stage VAD: cheap energy gate in front of Silero.
+
+On PSTN calls a large share of 20ms frames are line silence. Running the
+Silero ONNX model on them only to get a ~0 confidence dominates VAD CPU, so
+frames whose RMS energy is below a floor are scored as silence directly and
+only the rest reach Silero.
+"""
+
+import os
+from typing import Optional
+
+import numpy as np
+
+from pipecat.audio.vad.vad_analyzer import VADParams
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+from transports.silero_session import (
+    SILERO_VAD_BATCHING,
+    SileroSessionModel,
+    get_shared_silero_batcher,
+    get_shared_silero_session,
+)
+
+# ~-50 dBFS in int16 units; far below what VADParams.min_volume lets through
+PREFILTER_MIN_RMS = float(os.getenv("VAD_PREFILTER_MIN_RMS", "100"))
+
+
+class DSPEnergyPrefilter:
+    """RMS energy gate for 16-bit PCM frames."""
+
+    def __init__(self, min_rms: float = PREFILTER_MIN_RMS):
+        self.min_rms = min_rms
+        # Compare squared values so the hot path skips the sqrt
+        self._min_mean_square = min_rms * min_rms
+
+    def is_silence(self, buffer: bytes) -> bool:
+        samples = np.frombuffer(buffer, dtype=np.int16)
+        if samples.size == 0:
+            return True
+        samples = samples.astype(np.float32)
+        return float(np.dot(samples, samples)) / samples.size < self._min_mean_square
+
+
+class TwoStageVADAnalyzer(SileroVADAnalyzer):
+    """
+    Silero VAD analyzer that skips ONNX inference on frames the energy
+    prefilter classifies as silence.
+
+    Silero already resets its recurrent state every few seconds, so skipping
+    silent frames does not change how it scores the speech that follows.
+    The model runs on the process-wide session from silero_session rather
+    than a per-call one loaded by SileroVADAnalyzer, batched with other
+    calls unless SILERO_VAD_BATCHING is off.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+        min_rms: float = PREFILTER_MIN_RMS,
+    ):
+        # Skip SileroVADAnalyzer.__init__, which builds its own default session
+        super(SileroVADAnalyzer, self).__init__(sample_rate=sample_rate, params=params)
+        self._model = SileroSessionModel(
+            get_shared_silero_session(),
+            batcher=get_shared_silero_batcher() if SILERO_VAD_BATCHING else None,
+        )
+        self._last_reset_time = 0
+
+        self.prefilter = DSPEnergyPrefilter(min_rms=min_rms)
+        self.skipped_frames = 0
+
+    def voice_confidence(self, buffer) -> float:
+        if self.prefilter.is_silence(buffer):
+            self.skipped_frames += 1
+            return 0.0
+        return super().voice_confidence(buffer)
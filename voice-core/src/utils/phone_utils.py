@@ -2,14 +2,26 @@
 Phone number utilities (lightweight, no database dependencies).
 """
 
+import functools
 import re
 
+_NON_PHONE_CHARS_RE = re.compile(r"[^\d+]")
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_phone_number(phone: str) -> str:
     """
     Normalize phone number to E.164 format for matching.
+
+    Memoized: the same DIDs repeat across inbound webhooks, history lookups
+    and summary inserts.
     """
-    digits = re.sub(r"[^\d+]", "", phone)
+    # Fast path: already E.164 (what carrier webhooks send). isdecimal() matches
+    # exactly the characters `\d` accepts, so the result is identical.
+    if phone[:1] == "+" and phone[1:].isdecimal():
+        return phone
+
+    digits = _NON_PHONE_CHARS_RE.sub("", phone)
     if not digits:
         return phone
 
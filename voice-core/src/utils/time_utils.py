@@ -0,0 +1,14 @@
+"""
+Time helpers for Australian call handling (lightweight, no dependencies).
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# Resolved once per process
+SYDNEY_TZ = ZoneInfo("Australia/Sydney")
+
+
+def iso_now_sydney() -> str:
+    """Current time in Australia/Sydney as an ISO 8601 string."""
+    return datetime.now(SYDNEY_TZ).isoformat()
@@ -21,6 +21,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+_NON_DIGIT_RE = re.compile(r'\D')
+_MOBILE_RE = re.compile(r'^04\d{8}$')
+_LANDLINE_RE = re.compile(r'^(?:02|03|07|08)\d{8}$')
+_INTL_PLUS_RE = re.compile(r'^\+61[2-478]\d{8}$')
+_INTL_BARE_RE = re.compile(r'^61[2-478]\d{8}$')
+_POSTCODE_RE = re.compile(r'^\d{4}$')
+
 
 # Australian state codes mapping
 STATE_CODES = {
@@ -78,25 +86,25 @@ def validate_phone_au(phone: str) -> bool:
         return False
     
     # Remove all non-digits (except +)
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _NON_PHONE_CHARS_RE.sub('', phone)
     
     # Extract digits only for pattern matching
-    digits = re.sub(r'\D', '', cleaned)
+    digits = _NON_DIGIT_RE.sub('', cleaned)
     
     # Mobile: 04xx xxx xxx (10 digits starting with 04)
-    if re.match(r'^04\d{8}$', digits):
+    if _MOBILE_RE.match(digits):
         return True
     
     # Landline: 02/03/07/08 xxxx xxxx (10 digits)
-    if re.match(r'^(02|03|07|08)\d{8}$', digits):
+    if _LANDLINE_RE.match(digits):
         return True
     
     # International: +61 followed by 9 digits (without leading 0)
-    if cleaned.startswith('+61') and re.match(r'^\+61[2-478]\d{8}$', cleaned):
+    if cleaned.startswith('+61') and _INTL_PLUS_RE.match(cleaned):
         return True
     
     # Also accept 61 without + prefix
-    if digits.startswith('61') and re.match(r'^61[2-478]\d{8}$', digits):
+    if digits.startswith('61') and _INTL_BARE_RE.match(digits):
         return True
     
     logger.debug(f"Phone number failed validation: {phone}")
@@ -123,7 +131,7 @@ def normalize_phone_au(phone: str) -> str:
         Normalized phone number in +61 format
     """
     # Remove all non-digits
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     
     # If starts with 0, remove it and add +61
     if digits.startswith('0'):
@@ -217,8 +225,8 @@ def validate_address_au(
         return False
     
     # Postcode must be 4 digits
-    postcode_digits = re.sub(r'\D', '', postcode)
-    if not re.match(r'^\d{4}$', postcode_digits):
+    postcode_digits = _NON_DIGIT_RE.sub('', postcode)
+    if not _POSTCODE_RE.match(postcode_digits):
         return False
     
     return True
@@ -0,0 +1,277 @@
+import asyncio
+import io
+import wave
+
+import httpx
+import pytest
+
+from src.services import asr_services
+from src.services.asr_services import (
+    AssemblyAIService,
+    DeepgramBatchService,
+    _pcm_to_wav_bytes,
+    transcribe_all,
+)
+
+AUDIO = b"\x00\x01" * 16000
+
+
+@pytest.fixture(autouse=True)
+def clear_transcript_cache():
+    asr_services._recent_results.clear()
+    yield
+    asr_services._recent_results.clear()
+
+
+@pytest.mark.parametrize("sample_rate,channels", [(16000, 1), (8000, 2)])
+def test_pcm_to_wav_bytes_matches_wave_module(sample_rate, channels):
+    pcm = bytes(range(256)) * 8
+
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+
+    assert _pcm_to_wav_bytes(pcm, sample_rate, channels) == expected.getvalue()
+
+
+class RecordingService:
+    def __init__(self, text: str = "", error: Exception = None):
+        self.text = text
+        self.error = error
+        self.wav_bytes = None
+
+    async def transcribe(self, audio_bytes: bytes, wav_bytes: bytes = None) -> str:
+        self.wav_bytes = wav_bytes
+        if self.error:
+            raise self.error
+        return self.text
+
+
+class OtherRecordingService(RecordingService):
+    """A second provider; results are coalesced per provider class."""
+
+
+@pytest.mark.asyncio
+async def test_transcribe_all_shares_wav_and_maps_failures():
+    first = RecordingService("hello")
+    second = OtherRecordingService(error=RuntimeError("boom"))
+
+    results = await transcribe_all(AUDIO, [first, second])
+
+    assert results == ["hello", ""]
+    assert first.wav_bytes is second.wav_bytes
+    assert first.wav_bytes.startswith(b"RIFF")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_all_skips_empty_audio():
+    service = RecordingService("should not be called")
+
+    results = await transcribe_all(b"", [service])
+
+    assert results == [""]
+    assert service.wav_bytes is None
+
+
+def _deepgram_with_responses(statuses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        payload = {
+            "results": {"channels": [{"alternatives": [{"transcript": "g'day"}]}]}
+        }
+        return httpx.Response(status, json=payload)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = DeepgramBatchService(api_key="test-key", http_client=client)
+    return service, calls
+
+
+@pytest.mark.asyncio
+async def test_deepgram_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.RETRY_BASE_DELAY_S", 0)
+    service, calls = _deepgram_with_responses([503, 200])
+
+    assert await service.transcribe(AUDIO) == "g'day"
+    assert len(calls) == 2
+    assert service.failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_deepgram_circuit_opens_after_repeated_failures(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.RETRY_BASE_DELAY_S", 0)
+    service, calls = _deepgram_with_responses([503])
+
+    for _ in range(service.failure_threshold):
+        assert await service.transcribe(AUDIO) == ""
+    assert service.circuit_open
+
+    assert await service.transcribe(AUDIO) == ""
+    assert len(calls) == service.failure_threshold * asr_services.MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_deepgram_client_errors_do_not_open_circuit():
+    service, calls = _deepgram_with_responses([400])
+
+    for _ in range(service.failure_threshold + 1):
+        assert await service.transcribe(AUDIO) == ""
+
+    assert not service.circuit_open
+    assert service.failure_count == 0
+    assert len(calls) == service.failure_threshold + 1
+
+
+@pytest.mark.asyncio
+async def test_deepgram_half_open_trial_reopens_on_first_failure(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.RETRY_BASE_DELAY_S", 0)
+    service, calls = _deepgram_with_responses([503])
+    for _ in range(service.failure_threshold):
+        await service.transcribe(AUDIO)
+    service.last_failure_time -= service.recovery_timeout
+
+    assert await service.transcribe(AUDIO) == ""
+    assert service.circuit_open
+    assert len(calls) == (service.failure_threshold + 1) * asr_services.MAX_ATTEMPTS
+
+    # Reopened with a fresh timeout, so the next call is skipped
+    assert await service.transcribe(AUDIO) == ""
+    assert len(calls) == (service.failure_threshold + 1) * asr_services.MAX_ATTEMPTS
+
+
+class SlowService:
+    def __init__(self):
+        self.calls = 0
+
+    async def transcribe(self, audio_bytes: bytes, wav_bytes: bytes = None) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return "nought four one two"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_all_coalesces_identical_audio():
+    service = SlowService()
+
+    first, second = await asyncio.gather(
+        transcribe_all(AUDIO, [service]),
+        transcribe_all(AUDIO, [service]),
+    )
+    third = await transcribe_all(AUDIO, [service])
+
+    assert first == second == third == ["nought four one two"]
+    assert service.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_assemblyai_uploads_and_polls_over_rest(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.ASSEMBLYAI_POLL_INTERVAL_S", 0)
+    statuses = iter(["queued", "completed"])
+
+    def handler(request):
+        if request.url.path == "/v2/upload":
+            assert request.content.startswith(b"RIFF")
+            return httpx.Response(200, json={"upload_url": "https://cdn/audio"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "abc", "status": "queued"})
+        return httpx.Response(200, json={"status": next(statuses), "text": "no worries"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = AssemblyAIService(api_key="test-key", http_client=client)
+
+    assert await service.transcribe(AUDIO) == "no worries"
+
+
+@pytest.mark.asyncio
+async def test_assemblyai_retries_transient_errors_on_each_request(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.ASSEMBLYAI_POLL_INTERVAL_S", 0)
+    monkeypatch.setattr("src.services.asr_services.RETRY_BASE_DELAY_S", 0)
+    seen = []
+
+    def handler(request):
+        key = (request.method, request.url.path)
+        seen.append(key)
+        if seen.count(key) == 1:
+            return httpx.Response(503)
+        if request.url.path == "/v2/upload":
+            return httpx.Response(200, json={"upload_url": "https://cdn/audio"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "abc", "status": "queued"})
+        return httpx.Response(200, json={"status": "completed", "text": "no worries"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = AssemblyAIService(api_key="test-key", http_client=client)
+
+    assert await service.transcribe(AUDIO) == "no worries"
+    assert len(seen) == 6
+    assert service.failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_assemblyai_circuit_opens_after_repeated_outages(monkeypatch):
+    monkeypatch.setattr("src.services.asr_services.RETRY_BASE_DELAY_S", 0)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = AssemblyAIService(api_key="test-key", http_client=client)
+
+    for _ in range(service.failure_threshold):
+        assert await service.transcribe(AUDIO) == ""
+    assert service.circuit_open
+
+    assert await service.transcribe(AUDIO) == ""
+    assert len(calls) == service.failure_threshold * asr_services.MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_prewarm_includes_assemblyai(monkeypatch):
+    hosts = []
+
+    def handler(request):
+        hosts.append(request.url.host)
+        return httpx.Response(200)
+
+    for env_var in asr_services._PREWARM_URLS:
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.setenv("ASSEMBLYAI_API_KEY", "test-key")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(asr_services, "get_shared_http_client", lambda: client)
+
+    await asr_services.prewarm_shared_http_client()
+
+    assert hosts == ["api.assemblyai.com"]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_all_coalesces_across_service_instances():
+    first_call, second_call = SlowService(), SlowService()
+
+    first = await transcribe_all(AUDIO, [first_call])
+    second = await transcribe_all(AUDIO, [second_call])
+
+    assert first == second == ["nought four one two"]
+    assert first_call.calls + second_call.calls == 1
+    assert all(
+        isinstance(key[0], tuple) and not isinstance(key[0][0], SlowService)
+        for key in asr_services._recent_results
+    )
+
+
+@pytest.mark.asyncio
+async def test_transcribe_all_does_not_share_results_across_models():
+    nova, base = SlowService(), SlowService()
+    nova.model, base.model = "nova-3", "base"
+
+    await transcribe_all(AUDIO, [nova])
+    await transcribe_all(AUDIO, [base])
+
+    assert nova.calls == base.calls == 1
@@ -0,0 +1,99 @@
+import psycopg2.errors
+import pytest
+
+from src.database import db_service
+from src.database.db_service import PREPARED_STATEMENTS, DatabaseService
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=()):
+        name = query.split()[1]
+        error = self.conn.errors.get(name)
+        if error is not None:
+            raise error
+        self.conn.executed.append(name)
+
+
+class FakeConnection:
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.executed = []
+        self.rollbacks = 0
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        return None
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def getconn(self):
+        return self.conn
+
+
+def _service_with(conn) -> DatabaseService:
+    service = DatabaseService()
+    service.pool = FakePool(conn)
+    return service
+
+
+def test_failed_prepare_does_not_block_other_statements():
+    conn = FakeConnection(
+        errors={
+            "phone_routing_lookup": psycopg2.errors.DuplicatePreparedStatement(),
+            "tenant_config_lookup": psycopg2.errors.UndefinedTable(),
+        }
+    )
+    service = _service_with(conn)
+
+    assert service.get_connection() is conn
+
+    assert conn.executed == ["active_layer_2_lookup"]
+    assert conn.rollbacks == 2
+    # "already exists" counts as prepared
+    assert service.lookup_query(conn, "phone_routing_lookup") == (
+        "EXECUTE phone_routing_lookup(%s)"
+    )
+    assert service.lookup_query(conn, "active_layer_2_lookup") == (
+        "EXECUTE active_layer_2_lookup(%s)"
+    )
+    literal = service.lookup_query(conn, "tenant_config_lookup")
+    assert literal == PREPARED_STATEMENTS["tenant_config_lookup"].replace("$1", "%s")
+
+
+def test_statements_are_prepared_once_per_connection():
+    conn = FakeConnection()
+    service = _service_with(conn)
+
+    service.get_connection()
+    service.get_connection()
+
+    assert conn.executed == list(PREPARED_STATEMENTS)
+
+
+def test_prepared_statements_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(db_service, "USE_PREPARED_STATEMENTS", False)
+    conn = FakeConnection()
+    service = _service_with(conn)
+
+    service.get_connection()
+
+    assert conn.executed == []
+    assert "%s" in service.lookup_query(conn, "phone_routing_lookup")
+    assert "EXECUTE" not in service.lookup_query(conn, "phone_routing_lookup")
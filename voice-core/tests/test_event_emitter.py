@@ -0,0 +1,47 @@
+"""
+Unit tests for the Voice Core event emitter.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from events.event_emitter import EventEmitter
+
+
+@pytest.mark.asyncio
+async def test_emit_many_notifies_each_observer_once_per_batch(caplog):
+    emitter = EventEmitter(conversation_id="call-1")
+    sync_seen = []
+    async_seen = []
+
+    async def async_observer(event):
+        async_seen.append(event.event_type)
+
+    emitter.add_observer(lambda event: sync_seen.append(event.event_type))
+    emitter.add_observer(async_observer)
+
+    with caplog.at_level("INFO", logger="events.event_emitter"):
+        await emitter.emit_many([("first", {"n": 1}), ("second", None)])
+    await asyncio.sleep(0)
+
+    assert sync_seen == ["first", "second"]
+    assert async_seen == ["first", "second"]
+    assert [e.event_type for e in emitter.get_events()] == ["first", "second"]
+    assert len({e.timestamp for e in emitter.get_events()}) == 1
+    assert len([r for r in caplog.records if "VOICE_CORE_EVENT" in r.getMessage()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_emit_many_with_no_events_is_a_no_op():
+    emitter = EventEmitter()
+    emitter.add_observer(lambda event: pytest.fail("observer should not run"))
+
+    await emitter.emit_many([])
+
+    assert emitter.get_events() == []
@@ -20,9 +20,11 @@ tiktoken.encoding_for_model = lambda model: _DummyEncoding()
 from src.prompts.knowledge_combiner import (
     KnowledgeTooLargeError,
     MAX_STATIC_KNOWLEDGE_TOKENS,
+    build_system_prompt,
     combine_prompts,
     validate_static_knowledge,
 )
+from src.prompts import LAYER_1_CORE_PROMPT
 
 
 def test_validate_static_knowledge_small():
@@ -121,3 +123,13 @@ def test_knowledge_too_large_error_message():
         validate_static_knowledge(oversized)
 
     assert "Reduce knowledge size" in str(excinfo.value)
+
+
+def test_build_system_prompt_reuses_cached_prompt():
+    """Identical Layer 2 + knowledge should return the same cached string."""
+    first = build_system_prompt("You are Sarah.", "Hours: 9-5.")
+    second = build_system_prompt("You are Sarah.", "Hours: 9-5.")
+
+    assert first is second
+    assert first.startswith(LAYER_1_CORE_PROMPT.strip())
+    assert "You are Sarah." in first
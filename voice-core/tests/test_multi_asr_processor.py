@@ -1,19 +1,42 @@
+import asyncio
+
 import pytest
 
-from pipecat.frames.frames import AudioRawFrame, TranscriptionFrame
+from pipecat.frames.frames import AudioRawFrame, CancelFrame, TranscriptionFrame
 from pipecat.processors.frame_processor import FrameDirection
 
 from src.processors.multi_asr_processor import MultiASRProcessor
+from src.services import asr_services
 
 
 class FakeASRService:
     def __init__(self, text: str):
         self.text = text
 
-    async def transcribe(self, audio_bytes: bytes) -> str:
+    async def transcribe(self, audio_bytes: bytes, wav_bytes: bytes = None) -> str:
         return self.text
 
 
+# Transcripts are coalesced per provider class, so each slot gets its own
+class FakeDeepgramService(FakeASRService):
+    pass
+
+
+class FakeAssemblyAIService(FakeASRService):
+    pass
+
+
+class FakeOpenAIAudioService(FakeASRService):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clear_transcript_cache():
+    asr_services._recent_results.clear()
+    yield
+    asr_services._recent_results.clear()
+
+
 class CapturingMultiASR(MultiASRProcessor):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -26,9 +49,9 @@ class CapturingMultiASR(MultiASRProcessor):
 @pytest.mark.asyncio
 async def test_multi_asr_emits_transcription_on_flush():
     processor = CapturingMultiASR(
-        deepgram_batch=FakeASRService("hello"),
-        assemblyai=FakeASRService("hello there"),
-        openai_audio=FakeASRService("hi"),
+        deepgram_batch=FakeDeepgramService("hello"),
+        assemblyai=FakeAssemblyAIService("hello there"),
+        openai_audio=FakeOpenAIAudioService("hi"),
     )
     processor.enable_multi_asr()
 
@@ -40,9 +63,140 @@ async def test_multi_asr_emits_transcription_on_flush():
 
     frame = AudioRawFrame(audio=b"ab", sample_rate=1, num_channels=1)
     await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+    await processor._drain_pending_flushes()
 
     assert any(isinstance(f, TranscriptionFrame) for f in processor.captured)
     transcript = next(
         f.text for f in processor.captured if isinstance(f, TranscriptionFrame)
     )
     assert transcript == "hello there"
+
+
+class FakeRankerClient:
+    def __init__(self, choice: str):
+        self.calls = 0
+        self.chat = self
+        self.completions = self
+        self.choice = choice
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        message = type("Message", (), {"content": self.choice})()
+        choice = type("Choice", (), {"message": message})()
+        return type("Response", (), {"choices": [choice]})()
+
+
+@pytest.mark.asyncio
+async def test_rank_candidates_caches_llm_choice(monkeypatch):
+    from src.processors import multi_asr_processor
+
+    client = FakeRankerClient("2")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(multi_asr_processor, "_get_openai_client", lambda api_key: client)
+
+    processor = CapturingMultiASR(
+        deepgram_batch=FakeDeepgramService(""),
+        assemblyai=FakeAssemblyAIService(""),
+        openai_audio=FakeOpenAIAudioService(""),
+    )
+
+    first = await processor._rank_candidates(["four two", "for two"])
+    second = await processor._rank_candidates(["for two", "four two"])
+
+    assert first == "for two"
+    assert second == "for two"
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_silence_watchdog_exits_after_flush_and_stops_on_cancel():
+    processor = CapturingMultiASR(
+        deepgram_batch=FakeDeepgramService("hello"),
+        assemblyai=FakeAssemblyAIService("hello there"),
+        openai_audio=FakeOpenAIAudioService("hi"),
+    )
+    processor.enable_multi_asr()
+    processor.silence_timeout_ms = 10
+
+    frame = AudioRawFrame(audio=b"\x00\x00" * 3200, sample_rate=16000, num_channels=1)
+    await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+    watchdog = processor.silence_task
+    await asyncio.wait_for(watchdog, timeout=1)
+    await processor._drain_pending_flushes()
+
+    assert not processor.audio_buffer
+    assert any(isinstance(f, TranscriptionFrame) for f in processor.captured)
+
+    await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+    watchdog = processor.silence_task
+    assert watchdog is not None and not watchdog.done()
+
+    await processor.process_frame(CancelFrame(), FrameDirection.DOWNSTREAM)
+    await asyncio.sleep(0)
+
+    assert watchdog.cancelled()
+    assert processor.silence_task is None
+    assert not processor.audio_buffer
+
+
+class SlowASRService(FakeASRService):
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.started = asyncio.Event()
+        self.task = None
+
+    async def transcribe(self, audio_bytes: bytes, wav_bytes: bytes = None) -> str:
+        self.task = asyncio.current_task()
+        self.started.set()
+        await asyncio.sleep(10)
+        return self.text
+
+
+def _immediate_flush_processor(**services) -> CapturingMultiASR:
+    processor = CapturingMultiASR(**services)
+    processor.enable_multi_asr()
+    processor.max_buffer_duration_ms = 1
+    return processor
+
+
+@pytest.mark.asyncio
+async def test_cancel_frame_cancels_in_flight_transcriptions():
+    slow = SlowASRService("too late")
+    processor = _immediate_flush_processor(
+        deepgram_batch=slow,
+        assemblyai=FakeAssemblyAIService(""),
+        openai_audio=FakeOpenAIAudioService(""),
+    )
+
+    frame = AudioRawFrame(audio=b"\x00\x00" * 3200, sample_rate=16000, num_channels=1)
+    await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+    await asyncio.wait_for(slow.started.wait(), timeout=1)
+
+    await processor.process_frame(CancelFrame(), FrameDirection.DOWNSTREAM)
+
+    assert not processor._flush_tasks
+    assert not any(isinstance(f, TranscriptionFrame) for f in processor.captured)
+    assert isinstance(processor.captured[-1], CancelFrame)
+    # The provider call itself is shielded for coalescing; stop it here
+    slow.task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_failed_background_transcription_is_logged(caplog):
+    processor = _immediate_flush_processor(
+        deepgram_batch=FakeDeepgramService("hello"),
+        assemblyai=FakeAssemblyAIService("hello"),
+        openai_audio=FakeOpenAIAudioService("hello"),
+    )
+
+    async def boom(audio, direction):
+        raise RuntimeError("emit failed")
+
+    processor._transcribe_and_emit = boom
+    frame = AudioRawFrame(audio=b"\x00\x00" * 3200, sample_rate=16000, num_channels=1)
+    await processor.process_frame(frame, FrameDirection.DOWNSTREAM)
+    await processor._drain_pending_flushes()
+    await asyncio.sleep(0)
+
+    assert "background transcription failed" in caplog.text
+    assert not processor._flush_tasks
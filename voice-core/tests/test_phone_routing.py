@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.services import phone_routing
+from src.services.phone_routing import PhoneRoutingCache
+
+
+class FakeNotify:
+    def __init__(self, payload: str):
+        self.payload = payload
+
+
+class FakeListenConnection:
+    def __init__(self, payloads):
+        self.notifies = [FakeNotify(p) for p in payloads]
+
+    def poll(self):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def clear_phone_cache():
+    phone_routing._phone_cache.clear()
+    yield
+    phone_routing._phone_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_notification_drops_number_and_reloads(monkeypatch):
+    tables = iter([
+        {"+61400000001": "tenant-a", "+61400000002": "tenant-a"},
+        {"+61400000002": "tenant-a", "+61400000001": "tenant-b"},
+    ])
+
+    async def fake_executor(fn, *args):
+        return next(tables)
+
+    monkeypatch.setattr(phone_routing, "run_in_db_executor", fake_executor)
+    cache = PhoneRoutingCache()
+    await cache.refresh()
+    phone_routing._cache_put(phone_routing._phone_cache, "+61400000001", "tenant-a")
+
+    cache._listen_conn = FakeListenConnection(["+61400000001"])
+    cache._on_listen_readable()
+
+    assert cache.get("+61400000001") is None
+    assert "+61400000001" not in phone_routing._phone_cache
+    await cache._reload_task
+    assert cache.get("+61400000001") == "tenant-b"
+
+
+@pytest.mark.asyncio
+async def test_load_overlapping_a_change_is_discarded(monkeypatch):
+    cache = PhoneRoutingCache()
+    cache._routes = {"+61400000001": "tenant-a"}
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_executor(fn, *args):
+        loading.set()
+        await release.wait()
+        return {"+61400000001": "tenant-a"}
+
+    monkeypatch.setattr(phone_routing, "run_in_db_executor", slow_executor)
+    refresh = asyncio.create_task(cache.refresh())
+    await loading.wait()
+
+    cache._generation += 1
+    cache.discard_phone("+61400000001")
+    release.set()
+    await refresh
+
+    assert cache.get("+61400000001") is None
+
+
+@pytest.mark.asyncio
+async def test_reload_interval_is_bounded_by_ttl_without_listener(monkeypatch):
+    sleeps = []
+
+    async def fake_executor(fn, *args):
+        if fn is phone_routing._open_listen_connection:
+            raise RuntimeError("no LISTEN")
+        return {}
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(phone_routing, "run_in_db_executor", fake_executor)
+    monkeypatch.setattr(phone_routing.asyncio, "sleep", fake_sleep)
+    cache = PhoneRoutingCache(refresh_interval_s=300)
+
+    with pytest.raises(asyncio.CancelledError):
+        await cache._refresh_loop()
+
+    assert sleeps == [phone_routing.ROUTING_CACHE_TTL_S]
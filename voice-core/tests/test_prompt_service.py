@@ -4,14 +4,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
-from src.prompts.layer1_foundation import get_layer1_prompt
+from src.prompts import get_layer1_core_prompt
+from src.services import prompt_service
 from src.services.prompt_service import PromptService
 
 
+def _activate(prompts: List[Dict[str, Any]], target: Dict[str, Any]) -> None:
+    # Mirrors the one-active-per-tenant unique index, checked per row
+    if any(p.get("is_active") for p in prompts if p is not target):
+        raise AssertionError("unique index violation: two active prompts")
+    target["is_active"] = True
+
+
 class FakeCursor:
-    def __init__(self, store: Dict[str, List[Dict[str, Any]]], metrics: Dict[str, int]):
+    def __init__(
+        self,
+        store: Dict[str, List[Dict[str, Any]]],
+        metrics: Dict[str, int],
+        writes: List[Tuple[str, int]],
+    ):
         self.store = store
         self.metrics = metrics
+        self.writes = writes
         self._fetchone: Optional[Dict[str, Any]] = None
 
     def __enter__(self):
@@ -22,7 +36,7 @@ class FakeCursor:
 
     def execute(self, query: str, params: Tuple[Any, ...] = ()):
         q = " ".join(query.strip().lower().split())
-        if q.startswith("select") and "from prompts" in q and "layer_2_content" in q:
+        if q.startswith("execute active_layer_2_lookup"):
             self.metrics["select_active"] += 1
             tenant_id = params[0]
             prompts = self.store.get(tenant_id, [])
@@ -32,31 +46,37 @@ class FakeCursor:
             else:
                 active_sorted = sorted(active, key=lambda p: p["version"], reverse=True)
                 self._fetchone = {"layer_2_content": active_sorted[0]["layer_2_content"]}
-        elif "coalesce(max(version)" in q:
+        elif q.startswith("with next as") and "insert into prompts" in q:
             self.metrics["select_next_version"] += 1
-            tenant_id = params[0]
-            prompts = self.store.get(tenant_id, [])
-            max_version = max([p["version"] for p in prompts], default=0)
-            self._fetchone = {"next_version": max_version + 1}
-        elif q.startswith("update prompts set is_active = false"):
-            tenant_id = params[0]
-            for prompt in self.store.get(tenant_id, []):
+            tenant_id, _, _, content, created_by, metadata = params
+            prompts = self.store.setdefault(tenant_id, [])
+            next_version = max([p["version"] for p in prompts], default=0) + 1
+            for prompt in prompts:
                 prompt["is_active"] = False
-        elif q.startswith("insert into prompts"):
-            tenant_id, version, content, created_by, metadata = params
-            self.store.setdefault(tenant_id, []).append(
+            prompts.append(
                 {
-                    "version": version,
+                    "version": next_version,
                     "layer_2_content": content,
                     "is_active": True,
                     "created_by": created_by,
                     "metadata": metadata,
                 }
             )
-        elif q.startswith("update prompts") and "is_active = true" in q and "version" in q:
-            tenant_id, version = params
-            for prompt in self.store.get(tenant_id, []):
-                prompt["is_active"] = prompt["version"] == version
+            self._fetchone = {"version": next_version}
+        elif q.startswith("with deactivated as"):
+            tenant_id, version, _, _ = params
+            # The activating UPDATE is only ordered after the CTE if it reads it
+            _, _, activation = q.partition(") update prompts set is_active = true")
+            assert "from deactivated" in activation
+            prompts = self.store.get(tenant_id, [])
+            for prompt in prompts:
+                if prompt.get("is_active") and prompt["version"] != version:
+                    prompt["is_active"] = False
+                    self.writes.append(("deactivate", prompt["version"]))
+            for prompt in prompts:
+                if prompt["version"] == version:
+                    _activate(prompts, prompt)
+                    self.writes.append(("activate", version))
         else:
             raise AssertionError(f"Unexpected query: {query}")
 
@@ -68,9 +88,10 @@ class FakeConnection:
     def __init__(self, store: Dict[str, List[Dict[str, Any]]], metrics: Dict[str, int]):
         self.store = store
         self.metrics = metrics
+        self.writes: List[Tuple[str, int]] = []
 
     def cursor(self, cursor_factory=None):
-        return FakeCursor(self.store, self.metrics)
+        return FakeCursor(self.store, self.metrics, self.writes)
 
     def commit(self):
         return None
@@ -88,6 +109,9 @@ class FakeDbService:
     def get_connection(self):
         return self.connection
 
+    def lookup_query(self, conn, name: str) -> str:
+        return f"EXECUTE {name}(%s)"
+
     def put_connection(self, conn):
         return None
 
@@ -113,7 +137,7 @@ def test_get_system_prompt_combines_layers():
 
     combined = service.get_system_prompt(tenant_id)
 
-    assert get_layer1_prompt() in combined
+    assert get_layer1_core_prompt() in combined
     assert "Layer 2 content" in combined
 
 
@@ -166,10 +190,60 @@ def test_rollback_version():
     assert "Version 2" not in service.get_system_prompt(tenant_id)
 
 
+def test_rollback_deactivates_current_row_before_activating_target():
+    tenant_id = "tenant-8"
+    service, store, _ = _build_service(
+        store={
+            tenant_id: [
+                {"version": 1, "layer_2_content": "Version 1", "is_active": False},
+                {"version": 2, "layer_2_content": "Version 2", "is_active": True},
+                {"version": 3, "layer_2_content": "Version 3", "is_active": False},
+            ]
+        }
+    )
+
+    service.rollback_version(tenant_id, 1)
+
+    assert service.db.connection.writes == [("deactivate", 2), ("activate", 1)]
+    assert [p["is_active"] for p in store[tenant_id]] == [True, False, False]
+
+
+def test_update_layer_2_returns_next_version():
+    tenant_id = "tenant-7"
+    service, store, metrics = _build_service(
+        store={
+            tenant_id: [
+                {"version": 1, "layer_2_content": "Version 1", "is_active": True}
+            ]
+        }
+    )
+
+    assert service.update_layer_2(tenant_id, "Version 2") == 2
+    assert metrics["select_next_version"] == 1
+    assert [p["is_active"] for p in store[tenant_id]] == [False, True]
+
+
 def test_fallback_when_no_active_prompt():
     tenant_id = "tenant-5"
     service, store, _ = _build_service()
 
     combined = service.get_system_prompt(tenant_id)
 
-    assert combined == get_layer1_prompt()
+    assert combined == get_layer1_core_prompt()
+
+
+def test_cache_entries_expire_after_ttl(monkeypatch):
+    tenant_id = "tenant-6"
+    service, store, metrics = _build_service(
+        store={
+            tenant_id: [
+                {"version": 1, "layer_2_content": "Layer 2", "is_active": True}
+            ]
+        }
+    )
+    monkeypatch.setattr(prompt_service, "LAYER_2_CACHE_TTL_S", 0)
+
+    service.get_system_prompt(tenant_id)
+    service.get_system_prompt(tenant_id)
+
+    assert metrics["select_active"] == 2
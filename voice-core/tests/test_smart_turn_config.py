@@ -2,6 +2,7 @@
 Unit tests for Smart Turn V3 configuration.
 """
 
+import inspect
 import os
 import sys
 from pathlib import Path
@@ -63,3 +64,20 @@ def test_smart_turn_analyzer_creation_disabled():
         analyzer = SmartTurnConfig.create_analyzer(sample_rate=16000)
 
         assert analyzer is None
+
+
+def test_create_analyzer_inspects_class_once():
+    analyzer_class = MagicMock()
+    with patch(
+        "transports.smart_turn_config._load_smart_turn_class",
+        return_value=analyzer_class,
+    ), patch(
+        "transports.smart_turn_config.inspect.signature",
+        wraps=inspect.signature,
+    ) as signature:
+        with patch.dict(os.environ, {"SMART_TURN_ENABLED": "true"}):
+            SmartTurnConfig.create_analyzer(sample_rate=16000)
+            SmartTurnConfig.create_analyzer(sample_rate=16000)
+
+    assert analyzer_class.call_count == 2
+    assert signature.call_count == 1
@@ -19,9 +19,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from transports.daily_transport import DailyTransportWrapper
 from transports.twilio_transport import (
     TwilioTransportWrapper,
+    AUDIO_ENCODINGS,
+    AudioEncoding,
     AudioEncodingMismatchError,
+    check_audio_encoding,
     validate_audio_pipeline_compatibility
 )
+from transports.vad_prefilter import DSPEnergyPrefilter, TwoStageVADAnalyzer
+from transports.silero_session import SileroBatcher
 from events.event_emitter import EventEmitter
 
 
@@ -88,6 +93,41 @@ class TestTwilioTransport:
         assert encoding["sample_rate"] == 8000, "Twilio PSTN must use 8kHz sample rate"
         assert encoding["channels"] == 1
     
+    def test_audio_encoding_uses_shared_registry_entry(self):
+        """Test wrappers share the pre-validated encoding and emit it as a dict"""
+        wrapper = MagicMock(transport_type="pstn")
+        encoding = TwilioTransportWrapper._get_audio_encoding(wrapper)
+
+        assert encoding is AUDIO_ENCODINGS["pstn"]
+        assert encoding["sample_rate"] == 8000
+        assert encoding.as_dict() == {
+            "encoding": "mulaw",
+            "sample_rate": 8000,
+            "channels": 1,
+            "provider": "twilio",
+            "transport": "pstn",
+        }
+
+    def test_unknown_transport_type_raises_encoding_error(self):
+        """Test an unregistered transport type is a domain error, not a KeyError"""
+        wrapper = MagicMock(transport_type="sip")
+
+        with pytest.raises(AudioEncodingMismatchError, match="sip"):
+            TwilioTransportWrapper._get_audio_encoding(wrapper)
+
+        with pytest.raises(AudioEncodingMismatchError, match="sip"):
+            check_audio_encoding("sip", AUDIO_ENCODINGS["pstn"])
+
+    def test_registry_entries_meet_provider_requirements(self):
+        """Test every registry entry passes the check run at import time"""
+        for transport_type, encoding in AUDIO_ENCODINGS.items():
+            check_audio_encoding(transport_type, encoding)
+
+        with pytest.raises(AudioEncodingMismatchError, match="8kHz sample rate"):
+            check_audio_encoding(
+                "pstn", AudioEncoding("mulaw", 16000, 1, "twilio", "pstn")
+            )
+
     def test_audio_encoding_mismatch_detection_encoding(self):
         """Test audio encoding mismatch detection (wrong encoding)"""
         event_emitter = EventEmitter()
@@ -130,6 +170,32 @@ class TestTwilioTransport:
                     transport_type="pstn",
                 )
     
+    @pytest.mark.asyncio
+    async def test_start_does_not_wait_for_event_listeners(self):
+        """Test call_started is emitted in the background so start() returns immediately"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        release = asyncio.Event()
+        emitted = []
+
+        async def slow_emit(event_type, data):
+            await release.wait()
+            emitted.append(event_type)
+
+        wrapper = object.__new__(TwilioTransportWrapper)
+        wrapper.transport = AsyncMock()
+        wrapper.event_emitter = MagicMock(emit=slow_emit)
+        wrapper._call_started_base = {"provider": "twilio"}
+        wrapper._emit_tasks = set()
+
+        await asyncio.wait_for(wrapper.start(call_sid="CA123"), timeout=1)
+        assert emitted == []
+
+        release.set()
+        await asyncio.gather(*wrapper._emit_tasks)
+        assert emitted == ["call_started"]
+    
     def test_webrtc_transport_not_implemented(self):
         """Test Twilio WebRTC transport raises NotImplementedError in V1"""
         event_emitter = EventEmitter()
@@ -152,6 +218,14 @@ class TestTwilioTransport:
 class TestAudioPipelineCompatibility:
     """Tests for audio pipeline encoding compatibility validation"""
     
+    def test_validate_registry_encodings(self):
+        """Test validation accepts shared AudioEncoding entries"""
+        pstn = AUDIO_ENCODINGS["pstn"]
+        validate_audio_pipeline_compatibility(pstn, pstn, pstn)
+
+        with pytest.raises(AudioEncodingMismatchError, match="Encoding mismatch"):
+            validate_audio_pipeline_compatibility(pstn, pstn, AUDIO_ENCODINGS["webrtc"])
+
     def test_validate_compatible_encodings(self):
         """Test validation passes for compatible encodings"""
         telephony_encoding = {
@@ -232,3 +306,83 @@ class TestAudioPipelineCompatibility:
                 stt_encoding,
                 tts_encoding
             )
+
+
+def _require_real_silero():
+    # Other test modules replace pipecat with stubs in sys.modules
+    if not hasattr(sys.modules.get("pipecat.audio.vad.silero"), "SileroOnnxModel"):
+        pytest.skip("pipecat Silero VAD is stubbed in this session")
+
+
+class TestVADPrefilter:
+    """Tests for the energy-gated Silero VAD"""
+
+    def test_energy_prefilter_threshold(self):
+        """Test the RMS gate separates line silence from speech-level audio"""
+        prefilter = DSPEnergyPrefilter(min_rms=100)
+
+        assert prefilter.is_silence(b"\x00\x00" * 256)
+        assert prefilter.is_silence(b"\x32\x00" * 256)  # constant 50
+        assert not prefilter.is_silence(b"\xe8\x03" * 256)  # constant 1000
+        assert prefilter.is_silence(b"")
+
+    def test_silent_frames_skip_silero(self):
+        """Test frames below the energy floor never reach the ONNX model"""
+        _require_real_silero()
+        vad = TwoStageVADAnalyzer(sample_rate=8000)
+        vad.set_sample_rate(8000)
+        vad._model = MagicMock(side_effect=AssertionError("Silero should not run"))
+
+        assert vad.voice_confidence(b"\x00\x00" * 256) == 0.0
+        assert vad.skipped_frames == 1
+
+    def test_loud_frames_reach_silero(self):
+        """Test frames above the energy floor are scored by Silero"""
+        _require_real_silero()
+        vad = TwoStageVADAnalyzer(sample_rate=8000)
+        vad.set_sample_rate(8000)
+        vad._model = MagicMock(return_value=[0.9])
+
+        loud = (b"\xff\x7f\x01\x80") * 128
+        assert vad.voice_confidence(loud) == 0.9
+        assert vad.skipped_frames == 0
+
+    def test_silero_session_is_single_threaded(self):
+        """Test the VAD model runs on a one-thread ORT session"""
+        _require_real_silero()
+        vad = TwoStageVADAnalyzer(sample_rate=8000)
+
+        opts = vad._model.session.get_session_options()
+        assert opts.intra_op_num_threads == 1
+        assert opts.inter_op_num_threads == 1
+
+    def test_analyzers_share_session_not_state(self):
+        """Test calls share one ONNX session but keep their own recurrent state"""
+        _require_real_silero()
+        first = TwoStageVADAnalyzer(sample_rate=8000)
+        second = TwoStageVADAnalyzer(sample_rate=8000)
+
+        assert first._model.session is second._model.session
+        assert first._model is not second._model
+
+    def test_batcher_splits_batched_run_per_stream(self):
+        """Test one batched session run returns each stream its own slice"""
+        import numpy as np
+        from concurrent.futures import Future
+
+        session = MagicMock()
+        session.run.side_effect = lambda _, feeds: (feeds["input"][:, :1], feeds["state"] + 1)
+        batcher = SileroBatcher(session)
+
+        items = []
+        for i in range(3):
+            x = np.full((1, 288), i, dtype=np.float32)
+            state = np.full((2, 1, 128), i, dtype=np.float32)
+            items.append((x, state, 8000, Future()))
+        batcher._run_batch(8000, items)
+
+        session.run.assert_called_once()
+        for i, item in enumerate(items):
+            out, state = item[3].result()
+            assert out.shape == (1, 1) and out[0, 0] == i
+            assert state.shape == (2, 1, 128) and state[0, 0, 0] == i + 1